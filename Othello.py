@@ -6,13 +6,93 @@
 # represents Othello game that creates players, initializes the game board, takes and
 # validates position from player. If position is valid, places piece on the board
 # and captures opponent's pieces in valid directions. Keeps count of players' pieces and
-# returns a winner when no player can make a valid move.
+# returns a winner when no player can make a valid move. The optional bitboard engine keeps
+# each color's pieces in an integer of size * size bits (64 on the standard board) and only
+# builds the (size + 2) x (size + 2) self._board when it is read.
+# Boards of any even size from 6x6 to 16x16 can be played; the search, book and endgame
+# features need the standard 8x8 board.
+
+import collections
+
+import bitboard
+import endgame
+import mcts
+import search
+
+# (row step, col step) for each of the eight directions a line of pieces can run
+DIRECTIONS = ((0, 1), (0, -1), (-1, 0), (1, 0), (-1, 1), (1, 1), (-1, -1), (1, -1))
+
+
+def build_rays(size=8):
+    """takes board size as a parameter; builds, for each playing square, the lines of positions
+    running from the square to the edge in each direction; lines shorter than two squares are
+    left out since they can never capture; returns dictionary of position to tuple of lines"""
+    rays = {}
+
+    for row in range(1, size + 1):
+        for col in range(1, size + 1):
+            lines = []
+            for row_step, col_step in DIRECTIONS:
+                line = []
+                next_row = row + row_step
+                next_col = col + col_step
+
+                while 1 <= next_row <= size and 1 <= next_col <= size:
+                    line.append((next_row, next_col))
+                    next_row += row_step
+                    next_col += col_step
+
+                if len(line) >= 2:
+                    lines.append(tuple(line))
+
+            rays[(row, col)] = tuple(lines)
+
+    return rays
+
+
+RAYS = build_rays()
+_rays_by_size = {8: RAYS}
+
+
+def rays_for_size(size):
+    """takes board size as a parameter; returns build_rays for that size, built once"""
+    if size not in _rays_by_size:
+        _rays_by_size[size] = build_rays(size)
+    return _rays_by_size[size]
+
+# what play_game did: whether the move was accepted, the move and the pieces it flipped, the
+# color to move next and its available positions, and the end of game state and piece counts
+MoveResult = collections.namedtuple(
+    "MoveResult", ["accepted", "color", "position", "flipped", "next_color",
+                   "available_positions", "game_over", "winner", "black_pieces", "white_pieces",
+                   "move_stats"], defaults=(None,))
+
+# numbers of frontier discs (next to an empty square) and of legal moves for each color, and
+# the bitboard of stable discs (ones no move can flip) with how many each color has
+PositionFeatures = collections.namedtuple(
+    "PositionFeatures", ["black_frontier", "white_frontier", "black_mobility", "white_mobility",
+                         "stable", "black_stable", "white_stable"])
+
+START_HASH = bitboard.zobrist_hash(bitboard.START_BLACK, bitboard.START_WHITE)
+
+
+def format_move_stats(move_stats):
+    """takes dictionary of position to (visits, wins) from mcts_move as a parameter; returns
+    string listing each position with its visits and win rate"""
+    parts = []
+    for position, (visits, wins) in move_stats.items():
+        rate = wins / visits * 100 if visits else 0.0
+        parts.append("%s: %d visits, %.0f%% wins" % (position, visits, rate))
+
+    return "; ".join(parts)
 
 
 class Player:
     """represents a player object. Initializes player name and piece color. Used by
     Othello class to create player"""
 
+    __slots__ = ("_name", "_color")
+
     def __init__(self, name, color):
         """takes player name and piece color as parameters and initializes them to
         self._name and self._color respectively"""
@@ -34,37 +114,106 @@ class Othello:
     validates the move; if valid, will place piece at position and return the updated board;
     checks if game has ended and returns winner; calls on player class to create players"""
 
-    def __init__(self):
+    # no per-game __dict__; with the bitboard engine a game is little more than two integers,
+    # while the list engine also holds its list board and legal move sets, about 2 KB
+    __slots__ = ("_engine", "_board", "_player_list", "_black_pieces", "_white_pieces",
+                 "_white_available_positions", "_black_available_positions", "_valid_directions",
+                 "_end", "_winning_color", "_player_color", "_opponent_color", "_black_moves",
+                 "_white_moves", "_flipped_positions", "_searcher", "_to_move", "_hash",
+                 "_undo_stack", "_quiet", "_listeners", "_move_hints", "_black_bits",
+                 "_white_bits", "_frontier", "_stable", "_full_lines", "_geometry", "_rays")
+
+    def __new__(cls, engine="list", quiet=False, size=8):
+        """picks the class that plays the game for the requested engine; takes optional engine
+        name, quiet flag and board size as parameters; returns a BitboardOthello object for
+        "bitboard" """
+        if engine not in ("list", "bitboard"):
+            raise ValueError("engine must be 'list' or 'bitboard'")
+        bitboard.geometry(size)  # raises ValueError for an unsupported size
+
+        if engine == "bitboard" and cls is Othello:
+            cls = BitboardOthello
+
+        return super().__new__(cls)
+
+    def __init__(self, engine="list", quiet=False, size=8):
         """initializes game board, player list, number of pieces on board for each player, list
-        of available positions, list of valid directions, and winner;
-        takes no parameters"""
-        self._board = [
-            ["*", "*", "*", "*", "*", "*", "*", "*", "*", "*"],
-            ["*", ".", ".", ".", ".", ".", ".", ".", ".", "*"],
-            ["*", ".", ".", ".", ".", ".", ".", ".", ".", "*"],
-            ["*", ".", ".", ".", ".", ".", ".", ".", ".", "*"],
-            ["*", ".", ".", ".", "O", "X", ".", ".", ".", "*"],
-            ["*", ".", ".", ".", "X", "O", ".", ".", ".", "*"],
-            ["*", ".", ".", ".", ".", ".", ".", ".", ".", "*"],
-            ["*", ".", ".", ".", ".", ".", ".", ".", ".", "*"],
-            ["*", ".", ".", ".", ".", ".", ".", ".", ".", "*"],
-            ["*", "*", "*", "*", "*", "*", "*", "*", "*", "*"]
-        ]
+        of available positions, list of valid directions, and winner; takes optional engine name,
+        quiet flag and board size as parameters: "list" plays on the (size + 2) x (size + 2)
+        self._board with "*" sentinels around it, "bitboard" plays on two integers (see
+        BitboardOthello); size is an even number from 6 to 16; a quiet game never prints, and
+        play_game returns a MoveResult instead"""
+        self._engine = engine
+        self._quiet = quiet
+        self._listeners = ()  # callbacks given a MoveResult after every play_game
+        self._move_hints = None  # mcts_move keyword arguments once enable_move_hints is called
+        self._geometry = geometry = bitboard.geometry(size)
+        self._rays = rays_for_size(size)  # the lines compute_flips walks from each position
+        self.start_board()
         self._player_list = []
         self._black_pieces = 2
         self._white_pieces = 2
-        self._white_available_positions = []
-        self._black_available_positions = []
-        self._valid_directions = []
+        self._white_available_positions = ()  # replaced by return_available_positions
+        self._black_available_positions = ()
+        self._valid_directions = ()  # replaced by validate_move
         self._end = False
         self._winning_color = None
         self._player_color = None
         self._opponent_color = None
+        self._flipped_positions = []  # filled by the capture functions during make_move
+        self._searcher = None  # created by best_move, keeps its transposition table between moves
+
+        # Zobrist hash of the board and side to move, updated one XOR per changed square
+        self._to_move = "black"
+        self._hash = START_HASH if size == 8 else geometry.zobrist_hash(geometry.start_black,
+                                                                          geometry.start_white)
+
+        # each color's pieces as a bitboard, and the position features place_piece keeps up to
+        # date from the squares a move changes: discs next to an empty square, discs that can
+        # never be flipped, and for each of bitboard.AXES the squares whose line is full
+        self._black_bits = geometry.start_black
+        self._white_bits = geometry.start_white
+        self._frontier = geometry.start_black | geometry.start_white
+        self._stable = 0
+        self._full_lines = (0, 0, 0, 0)
+
+        # one (color, position, captures, black pieces, white pieces, hash, color to move, end,
+        # winning color, frontier, stable discs, full lines) record per move, the counters and
+        # features taken from before the move
+        self._undo_stack = []
+
+    def start_board(self):
+        """helper function for __init__; sets up self._board at the starting position and the
+        legal moves of each color, which make_move keeps up to date so that check_end and
+        return_available_positions never have to rescan the board; does not return anything"""
+        geometry = self._geometry
+        self._board = geometry.to_board(geometry.start_black, geometry.start_white)
+        self._black_moves = set(geometry.positions(
+            geometry.legal_moves(geometry.start_black, geometry.start_white)))
+        self._white_moves = set(geometry.positions(
+            geometry.legal_moves(geometry.start_white, geometry.start_black)))
+
+    def get_board(self):
+        """returns self._board, the (size + 2) x (size + 2) list of lists board"""
+        return self._board
+
+    def board_string(self):
+        """returns self._board as the text print_board prints"""
+        return "\n".join("  ".join(row) for row in self._board)
 
     def print_board(self):
-        """prints self._board to console"""
-        for row in self._board:
-            print("  ".join(row))
+        """prints self._board to console; does nothing for a quiet game"""
+        if not self._quiet:
+            print(self.board_string())
+
+    def add_listener(self, callback):
+        """takes a function as a parameter; calls it with a MoveResult after every play_game,
+        valid or not"""
+        self._listeners = self._listeners + (callback,)
+
+    def remove_listener(self, callback):
+        """takes a function registered with add_listener as a parameter; stops calling it"""
+        self._listeners = tuple(listener for listener in self._listeners if listener != callback)
 
     def create_player(self, player_name, color):
         """calls Player class to create player object, adds player object to self._players; takes
@@ -74,9 +223,10 @@ class Othello:
 
     def play_game(self, player_color, piece_position):
         """takes player color and position chosen by player as parameters;
-        calls validate functions to see if move is valid; if valid, calls make move to update board,
-        calls check_winner to check if there is a winner, if so, calls return_winner and prints
-        final score and winner to console"""
+        finds the pieces the move flips to see if move is valid; if valid, places piece to update
+        board, calls check_winner to check if there is a winner, if so, calls return_winner and prints
+        final score and winner to console; a quiet game prints nothing and returns a MoveResult
+        instead; every registered listener is called with the MoveResult"""
         if player_color == "black":
             self._player_color = "X"
             self._opponent_color = "O"
@@ -85,22 +235,36 @@ class Othello:
             self._player_color = "O"
             self._opponent_color = "X"
 
-        # check if position is valid
-        self.validate_move(piece_position)
+        # check if position is valid; positions may be given as lists as well as tuples
+        piece_position = tuple(piece_position)
+        captures = self.find_captures(player_color, piece_position)
 
-        if not self._valid_directions:  # no valid directions
+        if not captures:  # no valid directions
             self.return_available_positions(player_color)
+            move_stats = None
+            if self._move_hints is not None:
+                move_stats = self.mcts_move(player_color, **self._move_hints).stats
+
+            if self._quiet or self._listeners:
+                result = self.move_result(False, player_color, piece_position, captures)._replace(
+                    move_stats=move_stats)
+                for listener in self._listeners:
+                    listener(result)
+                if self._quiet:
+                    return result
+
             print("Invalid Move")
             if player_color == "black":
                 print("Here are the valid moves: ", self._black_available_positions)
-                return "Invalid move"
             if player_color == "white":
                 print("Here are the valid moves: ", self._white_available_positions)
-                return "Invalid move"
+            if move_stats is not None:
+                print("Move statistics: ", format_move_stats(move_stats))
+            return "Invalid move"
 
         else:
             # make move
-            self.make_move(player_color, piece_position)
+            self.place_piece(player_color, piece_position, captures)
 
             # check for end of game
             if player_color == "white":
@@ -111,6 +275,13 @@ class Othello:
                 opponent_color = "white"
                 self.check_end(player_color, opponent_color)
 
+            if self._quiet or self._listeners:
+                result = self.move_result(True, player_color, piece_position, captures)
+                for listener in self._listeners:
+                    listener(result)
+                if self._quiet:
+                    return result
+
             if self._end:
                 white_score = str(self._white_pieces)
                 black_score = str(self._black_pieces)
@@ -118,10 +289,37 @@ class Othello:
                 print(scores)
                 print(self.return_winner())
 
+    def move_result(self, accepted, player_color, piece_position, captures):
+        """helper function for play_game; takes whether the move was played, player color,
+        position and the captures found for it as parameters; returns MoveResult describing the
+        move and the color to move next, which is the same color after an invalid move or when
+        the opponent has to pass, and None once the game has ended"""
+        opponent_color = "white" if player_color == "black" else "black"
+
+        if not accepted:
+            next_color = player_color
+        elif self._end:
+            next_color = None
+        elif self.has_available_positions(opponent_color):
+            next_color = opponent_color
+        else:
+            next_color = player_color
+
+        available = [] if next_color is None else self.return_available_positions(next_color)
+        flipped = self.captured_positions(captures) if accepted else []
+
+        return MoveResult(accepted, player_color, piece_position, flipped, next_color, available,
+                          self._end, self._winning_color, self._black_pieces, self._white_pieces)
+
+    def captured_positions(self, captures):
+        """takes captures returned by find_captures as a parameter; returns them as a list of
+        positions"""
+        return list(captures)
+
     def validate_move(self, piece_position):
-        """helper function for play_game to validate player's position
-        choice; calls each direction's validate function; for each valid
-        direction, adds to list of valid directions that will be used by make_move"""
+        """validates player's position choice; calls each direction's validate function; for
+        each valid direction, adds to list of valid directions that can be used by the capture
+        functions"""
         self._valid_directions = []
 
         if self.validate_right(piece_position) is True:
@@ -150,6 +348,219 @@ class Othello:
 
         return
 
+    def compute_flips(self, color, piece_position):
+        """takes player color and board position as parameters; walks the precomputed lines
+        from the position once and returns list of every opponent piece the move would flip,
+        empty if the position is off the board, already taken, or captures nothing"""
+        if color == "black":
+            player, opponent = "X", "O"
+        else:
+            player, opponent = "O", "X"
+
+        lines = self._rays.get(tuple(piece_position))
+        if lines is None or self._board[piece_position[0]][piece_position[1]] != ".":
+            return []
+
+        board = self._board
+        flips = []
+        for line in lines:
+            for index, (row, col) in enumerate(line):
+                if board[row][col] != opponent:
+                    if board[row][col] == player:  # line closed by player's piece
+                        flips.extend(line[:index])
+                    break
+
+        return flips
+
+    def find_captures(self, player_color, piece_position):
+        """helper function for play_game; takes player color and piece position as parameters;
+        returns the engine's own record of the pieces the move captures, here the list from
+        compute_flips; empty if move is invalid"""
+        return self.compute_flips(player_color, piece_position)
+
+    def place_piece(self, player_color, piece_position, captures):
+        """helper function for play_game and make_move; takes player color, piece position and
+        list of positions returned by compute_flips as parameters; places player's piece, flips
+        every captured piece in one pass, updates piece counts in bulk and re-checks available
+        positions; does not return anything"""
+        self._undo_stack.append((player_color, piece_position, captures, self._black_pieces,
+                                 self._white_pieces, self._hash, self._to_move, self._end,
+                                 self._winning_color, self._frontier, self._stable,
+                                 self._full_lines))
+
+        if player_color == "black":
+            self._player_color = "X"
+            self._opponent_color = "O"
+            self._black_pieces += 1 + len(captures)
+            self._white_pieces -= len(captures)
+
+        if player_color == "white":
+            self._player_color = "O"
+            self._opponent_color = "X"
+            self._white_pieces += 1 + len(captures)
+            self._black_pieces -= len(captures)
+
+        board = self._board
+        board[piece_position[0]][piece_position[1]] = self._player_color
+        for row, col in captures:
+            board[row][col] = self._player_color
+
+        square = self._geometry.position_to_square(piece_position)
+        flipped_squares = [self._geometry.position_to_square(position) for position in captures]
+        self.update_hash(player_color, square, flipped_squares)
+
+        changed = 1 << square
+        for flipped in flipped_squares:
+            changed |= 1 << flipped
+        if player_color == "black":
+            self._black_bits |= changed
+            self._white_bits &= ~changed
+        else:
+            self._white_bits |= changed
+            self._black_bits &= ~changed
+        self.update_features(square)
+
+        # re-check only the empty squares that can see a changed square
+        self._flipped_positions = captures
+        self.update_available_positions(piece_position)
+
+    def undo_move(self):
+        """takes back the last move placed by make_move or play_game, restoring the board, piece
+        counts, hash, available positions and end of game state from before it; returns tuple
+        of the color and position of the move taken back"""
+        if not self._undo_stack:
+            raise ValueError("no move to undo")
+
+        (player_color, piece_position, captures, self._black_pieces, self._white_pieces,
+         self._hash, self._to_move, self._end, self._winning_color, self._frontier, self._stable,
+         self._full_lines) = self._undo_stack.pop()
+
+        opponent_piece = "O" if player_color == "black" else "X"
+        board = self._board
+        board[piece_position[0]][piece_position[1]] = "."
+        for row, col in captures:
+            board[row][col] = opponent_piece
+
+        placed = 1 << self._geometry.position_to_square(piece_position)
+        flipped = 0
+        for position in captures:
+            flipped |= 1 << self._geometry.position_to_square(position)
+        if player_color == "black":
+            self._black_bits &= ~(placed | flipped)
+            self._white_bits |= flipped
+        else:
+            self._white_bits &= ~(placed | flipped)
+            self._black_bits |= flipped
+
+        self._flipped_positions = captures
+        self.update_available_positions(piece_position)
+
+        return player_color, piece_position
+
+    def fork(self):
+        """returns an independent copy of the game for what-if play: only the board (its rows,
+        or the two bitboards for the bitboard engine), the legal moves and the move history are
+        copied, one list deep, while the Player objects and precomputed tables are shared;
+        listeners and the search table are not carried over"""
+        game = object.__new__(type(self))
+        game.restore_state(self.__getstate__())
+        game.copy_board(self)
+        return game
+
+    def copy_board(self, game):
+        """helper function for fork; takes the game being forked as a parameter; copies its
+        board rows and legal moves; does not return anything"""
+        self._board = [row[:] for row in game._board]
+        self._black_moves = set(game._black_moves)
+        self._white_moves = set(game._white_moves)
+
+    def __getstate__(self):
+        """returns the compact state fork and pickle copy: the engine, board size, bitboards,
+        counters, hash, position features, players and move history; the board, legal moves
+        and tables are rebuilt from these"""
+        return (self._engine, self._geometry.size, self._quiet, self._black_bits,
+                self._white_bits, self._black_pieces, self._white_pieces, self._end,
+                self._winning_color, self._to_move, self._hash, self._frontier, self._stable,
+                self._full_lines, self._player_list, self._undo_stack, self._move_hints)
+
+    def __setstate__(self, state):
+        """takes state from __getstate__ as a parameter; restores the game from it"""
+        self.restore_state(state)
+        geometry = self._geometry
+        self._board = geometry.to_board(self._black_bits, self._white_bits)
+        self._black_moves = set(geometry.positions(geometry.legal_moves(self._black_bits,
+                                                                        self._white_bits)))
+        self._white_moves = set(geometry.positions(geometry.legal_moves(self._white_bits,
+                                                                        self._black_bits)))
+
+    def restore_state(self, state):
+        """helper function for __setstate__; takes state from __getstate__ as a parameter; sets
+        every attribute both engines share, copying the player list and move history so the
+        two games never change each other's; does not return anything"""
+        (self._engine, size, self._quiet, self._black_bits, self._white_bits, self._black_pieces,
+         self._white_pieces, self._end, self._winning_color, self._to_move, self._hash,
+         self._frontier, self._stable, self._full_lines, player_list, undo_stack,
+         self._move_hints) = state
+
+        self._geometry = bitboard.geometry(size)
+        self._rays = rays_for_size(size)
+        self._player_list = list(player_list)
+        self._undo_stack = list(undo_stack)
+        self._listeners = ()
+        self._searcher = None
+        self._flipped_positions = []
+        self._white_available_positions = ()
+        self._black_available_positions = ()
+        self._valid_directions = ()
+        self._player_color = None
+        self._opponent_color = None
+
+    def update_hash(self, player_color, square, flipped_squares):
+        """helper function for place_piece; takes player color, bit index of the placed piece and
+        iterable of bit indexes of flipped pieces as parameters; XORs the placed piece and each
+        flip into self._hash and hands the move to the opponent; does not return anything"""
+        geometry = self._geometry
+        if player_color == "black":
+            self._hash ^= geometry.zobrist_black[square]
+        else:
+            self._hash ^= geometry.zobrist_white[square]
+
+        for flipped in flipped_squares:
+            self._hash ^= geometry.zobrist_flip[flipped]
+
+        # the color that just moved hands the turn over; after a pass it already has
+        if self._to_move == player_color:
+            self._to_move = "white" if player_color == "black" else "black"
+            self._hash ^= geometry.zobrist_white_to_move
+
+    def update_features(self, square):
+        """helper function for place_piece, called once the bitboards hold the move; takes bit
+        index of the placed piece as a parameter; re-checks the frontier around that square only,
+        since flips change the color of a disc but not its empty neighbours, marks the lines
+        through the square that are now full and grows the stable discs from the last known
+        ones; does not return anything"""
+        geometry = self._geometry
+        occupied = self._black_bits | self._white_bits
+        empty = ~occupied & geometry.full
+
+        around = geometry.neighbours[square] | (1 << square)
+        frontier = self._frontier & ~around
+        for neighbour in bitboard.squares(around & occupied):
+            if geometry.neighbours[neighbour] & empty:
+                frontier |= 1 << neighbour
+        self._frontier = frontier
+
+        full_lines = self._full_lines
+        for axis, line in enumerate(geometry.lines[square]):
+            if occupied & line == line:
+                full_lines = full_lines[:axis] + (full_lines[axis] | line,) + full_lines[axis + 1:]
+        self._full_lines = full_lines
+
+        # with no corner taken and no full line no disc can be stable yet
+        if occupied & geometry.corners or self._full_lines != (0, 0, 0, 0):
+            self._stable = geometry.stable_discs(self._black_bits, self._white_bits,
+                                                 self._full_lines, self._stable)
+
     def validate_right(self, piece_position, row=None, col=None):
         """takes player color and board position chosen by player as parameters,
         called by validate_move and return_available_positions to check if pieces form a valid
@@ -421,408 +832,619 @@ class Othello:
 
     def make_move(self, color, piece_position):
         """helper function for play_game; takes player color and board position chosen by player
-        as parameters, called by play_game when player makes valid move, places player's piece and
-        calls capture_pieces to flips any captured tokens, returns board updated with player's move"""
-        # initialize colors and position
-        row = piece_position[0]
-        col = piece_position[1]
-
-        if color == "black":
-            self._player_color = "X"
-            self._opponent_color = "O"
-
-        if color == "white":
-            self._player_color = "O"
-            self._opponent_color = "X"
-
-        # get valid directions
-        self.validate_move(piece_position)
-
-        # put player's tile down and update piece count
-        self._board[row][col] = self._player_color
-
-        if color == "black":
-            self._black_pieces += 1
-
-        if color == "white":
-            self._white_pieces += 1
-
-        # flip pieces in each valid direction
-        for direction in self._valid_directions:
-            if direction == "right":
-                self.capture_right(color, piece_position)
-
-            if direction == "left":
-                self.capture_left(color, piece_position)
+        as parameters, places player's piece and flips the pieces found by compute_flips,
+        returns board updated with player's move"""
+        piece_position = tuple(piece_position)
+        self.place_piece(color, piece_position, self.compute_flips(color, piece_position))
+        return self._board
 
-            if direction == "up":
-                self.capture_up(color, piece_position)
+    def update_available_positions(self, piece_position):
+        """helper function for make_move and undo_move; takes position of the piece just placed
+        or taken back as a parameter; walks out from that position and each flipped piece in
+        every direction to the first empty square, since only those squares (and the position
+        itself once taken back) can have gained or lost a valid line; re-checks them for both
+        colors and updates self._black_moves and self._white_moves"""
+        self._black_moves.discard(piece_position)
+        self._white_moves.discard(piece_position)
 
-            if direction == "down":
-                self.capture_down(color, piece_position)
+        to_check = set()
+        if self._board[piece_position[0]][piece_position[1]] == ".":  # move was taken back
+            to_check.add(piece_position)
 
-            if direction == "right up":
-                self.capture_right_up(color, piece_position)
+        for row, col in [piece_position] + self._flipped_positions:
+            for row_step, col_step in DIRECTIONS:
+                next_row = row + row_step
+                next_col = col + col_step
 
-            if direction == "right down":
-                self.capture_right_down(color, piece_position)
+                # skip over pieces of either color
+                while self._board[next_row][next_col] == "X" or self._board[next_row][next_col] == "O":
+                    next_row += row_step
+                    next_col += col_step
 
-            if direction == "left up":
-                self.capture_left_up(color, piece_position)
+                if self._board[next_row][next_col] == ".":
+                    to_check.add((next_row, next_col))
 
-            if direction == "left down":
-                self.capture_left_down(color, piece_position)
+        player_color = self._player_color
+        opponent_color = self._opponent_color
 
-        return self._board
+        for position in to_check:
+            self._player_color = "X"
+            self._opponent_color = "O"
+            if self.is_available_position(position):
+                self._black_moves.add(position)
+            else:
+                self._black_moves.discard(position)
 
-    def capture_right(self, color, piece_position, row=None, col=None):
-        """helper function for make_move; takes player color and piece position as parameters;
-        flips any pieces captured to right of a player's move and updates board;
-        does not return anything"""
-        # initialize row and col
+            self._player_color = "O"
+            self._opponent_color = "X"
+            if self.is_available_position(position):
+                self._white_moves.add(position)
+            else:
+                self._white_moves.discard(position)
+
+        self._player_color = player_color
+        self._opponent_color = opponent_color
+
+    def is_available_position(self, piece_position):
+        """helper function for update_available_positions; takes a board position as a
+        parameter; walks the precomputed lines from the position and returns true as soon as one
+        forms a valid line for the current player color, false if none do"""
+        board = self._board
+        for line in self._rays[piece_position]:
+            for index, (row, col) in enumerate(line):
+                if board[row][col] != self._opponent_color:
+                    if index and board[row][col] == self._player_color:
+                        return True
+                    break
+
+        return False
+
+    def capture_line(self, color, piece_position, row_step, col_step, row=None, col=None):
+        """helper function for the capture_* functions; takes player color, piece position, the
+        direction to walk in and optional square to start from as parameters; flips the run of
+        opponent pieces next to the start in that direction when a piece of player's color
+        closes it, through flip_pieces so the bitboards, piece counts, hash, stable discs and
+        available positions stay in step with the board; does not return anything"""
         if row is None and col is None:
             row = piece_position[0]
             col = piece_position[1]
 
-        # end when reach player color in next position
-        if self._board[row][col + 1] == self._player_color:
-            return
-
-        # continue to next position if opponent's color
-        if self._board[row][col + 1] == self._opponent_color:
-            self._board[row][col + 1] = self._player_color  # change next to player's color
+        player, opponent = ("X", "O") if color == "black" else ("O", "X")
+        board = self._board
+        run = []
+
+        row += row_step
+        col += col_step
+        while board[row][col] == opponent:
+            run.append((row, col))
+            row += row_step
+            col += col_step
+
+        if run and board[row][col] == player:
+            self.flip_pieces(color, run)
+
+    def flip_pieces(self, color, positions):
+        """helper function for capture_line; takes player color and list of opponent piece
+        positions as parameters; turns them to player's color on the bitboards, updating piece
+        counts, hash and stable discs, then on the board and available positions through
+        flip_board; the frontier and full lines do not change, since no square was filled; does
+        not return anything"""
+        geometry = self._geometry
+        flipped = 0
+        for position in positions:
+            square = geometry.position_to_square(position)
+            flipped |= 1 << square
+            self._hash ^= geometry.zobrist_flip[square]
 
-            # update piece counts
-            if color == "black":
-                self._black_pieces += 1
-                self._white_pieces -= 1
-
-            if color == "white":
-                self._white_pieces += 1
-                self._black_pieces -= 1
+        if color == "black":
+            self._black_bits |= flipped
+            self._white_bits &= ~flipped
+            self._black_pieces += len(positions)
+            self._white_pieces -= len(positions)
+        else:
+            self._white_bits |= flipped
+            self._black_bits &= ~flipped
+            self._white_pieces += len(positions)
+            self._black_pieces -= len(positions)
+
+        # a disc marked stable before its flip was only stable in the half-made move, so the
+        # stable discs are searched again from nothing
+        stable = 0 if self._stable & flipped else self._stable
+        occupied = self._black_bits | self._white_bits
+        if occupied & geometry.corners or self._full_lines != (0, 0, 0, 0):
+            stable = geometry.stable_discs(self._black_bits, self._white_bits, self._full_lines,
+                                           stable)
+        self._stable = stable
+
+        self.flip_board(color, positions)
+
+    def flip_board(self, color, positions):
+        """helper function for flip_pieces; takes player color and list of flipped positions as
+        parameters; writes them into the board and re-checks the available positions around
+        them; does not return anything"""
+        symbol = "X" if color == "black" else "O"
+        for row, col in positions:
+            self._board[row][col] = symbol
+
+        self._flipped_positions = positions
+        self.update_available_positions(positions[0])
 
-            return self.capture_right(color, piece_position, row, col + 1)
+    def capture_right(self, color, piece_position, row=None, col=None):
+        """takes player color and piece position as parameters, for use after validate_move;
+        flips any pieces captured to right of a player's move and updates board;
+        does not return anything"""
+        self.capture_line(color, piece_position, 0, 1, row, col)
 
     def capture_left(self, color, piece_position, row=None, col=None):
-        """helper function for make_move; takes player color and piece position as parameters;
+        """takes player color and piece position as parameters, for use after validate_move;
         flips any pieces captured to left of a player's move and updates board;
         does not return anything"""
-        if row is None and col is None:
-            row = piece_position[0]
-            col = piece_position[1]
-
-        if self._board[row][col - 1] == self._player_color:
-            return
-
-        if self._board[row][col - 1] == self._opponent_color:
-            self._board[row][col - 1] = self._player_color
-
-            if color == "black":
-                self._black_pieces += 1
-                self._white_pieces -= 1
-
-            if color == "white":
-                self._white_pieces += 1
-                self._black_pieces -= 1
-
-            return self.capture_left(color, piece_position, row, col - 1)
+        self.capture_line(color, piece_position, 0, -1, row, col)
 
     def capture_up(self, color, piece_position, row=None, col=None):
-        """helper function for make_move; takes player color and piece position as parameters;
+        """takes player color and piece position as parameters, for use after validate_move;
         flips any pieces captured above a player's move and updates board; does not return anything"""
-        if row is None and col is None:
-            row = piece_position[0]
-            col = piece_position[1]
-
-        if self._board[row - 1][col] == self._player_color:
-            return
-
-        if self._board[row - 1][col] == self._opponent_color:
-            self._board[row - 1][col] = self._player_color
-
-            if color == "black":
-                self._black_pieces += 1
-                self._white_pieces -= 1
-
-            if color == "white":
-                self._white_pieces += 1
-                self._black_pieces -= 1
-
-            return self.capture_up(color, piece_position, row - 1, col)
+        self.capture_line(color, piece_position, -1, 0, row, col)
 
     def capture_down(self, color, piece_position, row=None, col=None):
-        """helper function for make_move; takes player color and piece position as parameters;
+        """takes player color and piece position as parameters, for use after validate_move;
         flips any pieces captured below a player's move and updates board; does not return anything"""
-        if row is None and col is None:
-            row = piece_position[0]
-            col = piece_position[1]
-
-        if self._board[row + 1][col] == self._player_color:
-            return
-
-        if self._board[row + 1][col] == self._opponent_color:
-            self._board[row + 1][col] = self._player_color
-
-            if color == "black":
-                self._black_pieces += 1
-                self._white_pieces -= 1
-
-            if color == "white":
-                self._white_pieces += 1
-                self._black_pieces -= 1
-
-            return self.capture_down(color, piece_position, row + 1, col)
+        self.capture_line(color, piece_position, 1, 0, row, col)
 
     def capture_right_up(self, color, piece_position, row=None, col=None):
-        """helper function for make_move; takes player color and piece position as parameters;
+        """takes player color and piece position as parameters, for use after validate_move;
         flips any pieces captured to right up diagonal of player's move and updates board;
         does not return anything"""
-        if row is None and col is None:
-            row = piece_position[0]
-            col = piece_position[1]
-
-        if self._board[row - 1][col + 1] == self._player_color:
-            return
-
-        if self._board[row - 1][col + 1] == self._opponent_color:
-            self._board[row - 1][col + 1] = self._player_color
-
-            if color == "black":
-                self._black_pieces += 1
-                self._white_pieces -= 1
-
-            if color == "white":
-                self._white_pieces += 1
-                self._black_pieces -= 1
-
-            return self.capture_right_up(color, piece_position, row - 1, col + 1)
+        self.capture_line(color, piece_position, -1, 1, row, col)
 
     def capture_right_down(self, color, piece_position, row=None, col=None):
-        """helper function for make_move; takes player color and piece position as parameters;
+        """takes player color and piece position as parameters, for use after validate_move;
         flips any pieces captured to right down diagonal of player's move and updates board;
         does not return anything"""
-        if row is None and col is None:
-            row = piece_position[0]
-            col = piece_position[1]
-
-        if self._board[row + 1][col + 1] == self._player_color:
-            return
-
-        if self._board[row + 1][col + 1] == self._opponent_color:
-            self._board[row + 1][col + 1] = self._player_color
-
-            if color == "black":
-                self._black_pieces += 1
-                self._white_pieces -= 1
-
-            if color == "white":
-                self._white_pieces += 1
-                self._black_pieces -= 1
-
-            return self.capture_right_down(color, piece_position, row + 1, col + 1)
+        self.capture_line(color, piece_position, 1, 1, row, col)
 
     def capture_left_up(self, color, piece_position, row=None, col=None):
-        """helper function for make_move; takes player color and piece position as parameters;
+        """takes player color and piece position as parameters, for use after validate_move;
         flips any pieces captured to left up diagonal of player's move and updates board;
         does not return anything"""
-        if row is None and col is None:
-            row = piece_position[0]
-            col = piece_position[1]
-
-        if self._board[row - 1][col - 1] == self._player_color:
-            return
-
-        if self._board[row - 1][col - 1] == self._opponent_color:
-            self._board[row - 1][col - 1] = self._player_color
-
-            if color == "black":
-                self._black_pieces += 1
-                self._white_pieces -= 1
-
-            if color == "white":
-                self._white_pieces += 1
-                self._black_pieces -= 1
-
-            return self.capture_left_up(color, piece_position, row - 1, col - 1)
+        self.capture_line(color, piece_position, -1, -1, row, col)
 
     def capture_left_down(self, color, piece_position, row=None, col=None):
-        """helper function for make_move; takes player color and piece position as parameters;
+        """takes player color and piece position as parameters, for use after validate_move;
         flips any pieces captured to left down diagonal of player's move and updates board;
         does not return anything"""
-        if row is None and col is None:
-            row = piece_position[0]
-            col = piece_position[1]
+        self.capture_line(color, piece_position, 1, -1, row, col)
 
-        if self._board[row + 1][col - 1] == self._player_color:
-            return
+    def return_available_positions(self, color):
+        """takes player color as a parameter, returns list of available positions for player to
+        chose for their turn from the legal moves make_move keeps up to date, in the same row by
+        row order as a scan of the board; called on by play_game after player attempts invalid move"""
+        if color == "black":
+            self._player_color = "X"
+            self._opponent_color = "O"
+            self._black_available_positions = sorted(self._black_moves)
+            return self._black_available_positions
 
-        if self._board[row + 1][col - 1] == self._opponent_color:
-            self._board[row + 1][col - 1] = self._player_color
+        if color == "white":
+            self._player_color = "O"
+            self._opponent_color = "X"
+            self._white_available_positions = sorted(self._white_moves)
+            return self._white_available_positions
 
-            if color == "black":
-                self._black_pieces += 1
-                self._white_pieces -= 1
+    def has_available_positions(self, color):
+        """helper function for check_end; takes player color as a parameter; returns true if
+        player has at least one valid move, false otherwise"""
+        if color == "black":
+            return bool(self._black_moves)
 
-            if color == "white":
-                self._white_pieces += 1
-                self._black_pieces -= 1
+        return bool(self._white_moves)
 
-            return self.capture_left_down(color, piece_position, row + 1, col - 1)
+    def check_end(self, color, opponent_color):
+        """ helper function for play_game; determines if either player still has a valid move;
+        if neither does, sets the game as ended and records winning color; if one does, returns
+        none; called by play_game after each turn"""
+        if self.has_available_positions(opponent_color):  # first check if opponent has moves
+            return
 
-    def return_available_positions(self, color):
-        """takes player color as a parameter, checks board for valid moves and returns
-        list of available positions for player to chose for their
-        turn; called on by play_game after player attempts invalid move"""
-        if color == "black":
-            self._black_available_positions = []
-            self._player_color = "X"
-            self._opponent_color = "O"
-            row = 0  # start at first row
+        if self.has_available_positions(color):  # check if player has valid moves
+            return
 
-            for line in self._board:
-                col = 0  # start at first column of each row
-                # validate each direction at each position
-                for pos in line:
-                    position = (row, col)
+        self._end = True  # reached end of game
 
-                    if self.validate_right(position) is True:
-                        if position not in self._black_available_positions:
-                            self._black_available_positions.append(position)
+        if self._black_pieces > self._white_pieces:
+            self._winning_color = "black"
 
-                    if self.validate_left(position) is True:
-                        if position not in self._black_available_positions:
-                            self._black_available_positions.append(position)
+        if self._white_pieces > self._black_pieces:
+            self._winning_color = "white"
 
-                    if self.validate_up(position) is True:
-                        if position not in self._black_available_positions:
-                            self._black_available_positions.append(position)
+        if self._white_pieces == self._black_pieces:
+            self._winning_color = "tie"
 
-                    if self.validate_down(position) is True:
-                        if position not in self._black_available_positions:
-                            self._black_available_positions.append(position)
+    def return_winner(self):
+        """helper function for play_game; called by play_game at end of game; returns
+        string with winner color and name; if tied, returns string stating there was a tie"""
+        if self._winning_color == "tie":
+            return "It's a tie"
 
-                    if self.validate_right_up(position) is True:
-                        if position not in self._black_available_positions:
-                            self._black_available_positions.append(position)
+        for player in self._player_list:
+            color = player.get_color()
 
-                    if self.validate_right_down(position) is True:
-                        if position not in self._black_available_positions:
-                            self._black_available_positions.append(position)
+            if color == self._winning_color:
+                name = player.get_name()
+                winner = "Winner is " + color + " player: " + name
+                return winner
 
-                    if self.validate_left_up(position) is True:
-                        if position not in self._black_available_positions:
-                            self._black_available_positions.append(position)
+    def get_winning_color(self):
+        """returns "black", "white" or "tie" once check_end has ended the game, None before"""
+        return self._winning_color
 
-                    if self.validate_left_down(position) is True:
-                        if position not in self._black_available_positions:
-                            self._black_available_positions.append(position)
+    def get_piece_counts(self):
+        """returns tuple of the number of black pieces and white pieces on the board"""
+        return self._black_pieces, self._white_pieces
 
-                    col += 1
+    def get_player_name(self, color):
+        """takes piece color as a parameter; returns name of the player created with that color,
+        None if there is none"""
+        for player in self._player_list:
+            if player.get_color() == color:
+                return player.get_name()
 
-                row += 1
+        return None
 
-            return self._black_available_positions
+    def get_move_history(self):
+        """returns list of (color, position) for every move played so far, in order"""
+        return [(record[0], record[1]) for record in self._undo_stack]
 
-        if color == "white":
-            self._white_available_positions = []
-            self._player_color = "O"
-            self._opponent_color = "X"
-            row = 0
+    def get_bitboards(self):
+        """returns tuple of the black and white bitboards of the current position"""
+        return self._black_bits, self._white_bits
 
-            for line in self._board:
-                col = 0  # start at first column of each row
-                # validate each direction at each position
-                for pos in line:
-                    position = (row, col)
+    def count_moves(self, color):
+        """takes player color as a parameter; returns number of legal moves for player, from
+        the moves make_move keeps up to date"""
+        if color == "black":
+            return len(self._black_moves)
+        return len(self._white_moves)
+
+    def position_features(self):
+        """returns PositionFeatures for the current position from the frontier discs, legal
+        moves and stable discs that make_move keeps up to date, without scanning the board"""
+        black, white = self._black_bits, self._white_bits
+        return PositionFeatures(
+            bitboard.popcount(self._frontier & black), bitboard.popcount(self._frontier & white),
+            self.count_moves("black"), self.count_moves("white"), self._stable,
+            bitboard.popcount(self._stable & black), bitboard.popcount(self._stable & white))
+
+    def position_hash(self):
+        """returns the 64-bit Zobrist hash of the board and the color to move, which is the
+        opponent of the color that made the last move"""
+        return self._hash
+
+    def get_size(self):
+        """returns number of rows and of columns of the board"""
+        return self._geometry.size
+
+    def check_standard_size(self, feature):
+        """helper function for the symmetry, book, search and endgame features, which work on
+        8x8 bitboards; takes feature name as a parameter; raises ValueError on any other board
+        size"""
+        if self._geometry.size != 8:
+            raise ValueError("%s needs an 8x8 board" % feature)
+
+    def canonical_position(self):
+        """returns tuple of the black and white bitboards of the canonical form of the current
+        position, the same for all eight rotations and reflections of it, and the symmetry
+        number that turns the current position into it"""
+        self.check_standard_size("canonical_position")
+        black, white = self.get_bitboards()
+        return bitboard.canonical(black, white)
+
+    def original_position(self, position, symmetry):
+        """takes a (row, col) position on the canonical board and the symmetry number returned
+        by canonical_position as parameters; returns the matching (row, col) on the board as it
+        is"""
+        self.check_standard_size("original_position")
+        square = bitboard.position_to_square(position)
+        inverse = bitboard.INVERSE_SYMMETRIES[symmetry]
+        return bitboard.square_to_position(bitboard.transform_square(square, inverse))
+
+    def canonical_hash(self):
+        """returns tuple of the Zobrist hash of the canonical form of the current position, with
+        the same color to move as position_hash, and the symmetry number that turns the
+        current position into the canonical form"""
+        black, white, symmetry = self.canonical_position()
+        return bitboard.zobrist_hash(black, white, self._to_move == "white"), symmetry
+
+    def book_moves(self, book):
+        """takes an opened book.OpeningBook as a parameter; returns list of book.BookMove with the
+        win, draw and loss counts of the moves the book has for the current position, empty
+        once the game is past the plies the book covers or the position is not in it; the book
+        is keyed by canonical position, so its moves are turned back to this board's
+        orientation"""
+        if len(self._undo_stack) >= book.get_plies():
+            return []
+
+        position_hash, symmetry = self.canonical_hash()
+        return [move._replace(position=self.original_position(move.position, symmetry))
+                for move in book.lookup(position_hash)]
+
+    def best_move(self, color, depth=None, time_limit=None):
+        """takes player color, optional maximum search depth and optional time limit in seconds
+        as parameters; searches the position with alpha-beta, deepening one ply at a time, and
+        returns SearchResult with the chosen position (None if player has to pass), its score
+        for player, the depth reached, nodes searched and nodes per second; searches 6 plies
+        when neither limit is given, and to the end of the game when only time_limit is"""
+        self.check_standard_size("best_move")
+        black, white = self.get_bitboards()
+        if color == "black":
+            player, opponent = black, white
+        else:
+            player, opponent = white, black
 
-                    if self.validate_right(position) is True:
-                        if position not in self._white_available_positions:
-                            self._white_available_positions.append(position)
+        if self._searcher is None:
+            self._searcher = search.Searcher()
 
-                    if self.validate_left(position) is True:
-                        if position not in self._white_available_positions:
-                            self._white_available_positions.append(position)
+        result = self._searcher.search(player, opponent, depth, time_limit)
+        if result.move is None:
+            return result
 
-                    if self.validate_up(position) is True:
-                        if position not in self._white_available_positions:
-                            self._white_available_positions.append(position)
+        return result._replace(move=bitboard.square_to_position(result.move))
 
-                    if self.validate_down(position) is True:
-                        if position not in self._white_available_positions:
-                            self._white_available_positions.append(position)
+    def mcts_move(self, color, iterations=None, time_limit=None, workers=1, policy="random", seed=0):
+        """takes player color, optional iteration budget, time limit in seconds, number of worker
+        processes (all cores when None), rollout policy name ("random" or "corners") and seed as
+        parameters; runs Monte Carlo tree search, root-parallel across the workers; returns
+        mcts.MCTSResult with the most visited position (None if player has to pass), dictionary
+        of position to (visits, wins) for each of player's moves and iterations run"""
+        self.check_standard_size("mcts_move")
+        black, white = self.get_bitboards()
+        if color == "black":
+            result = mcts.run_mcts(black, white, iterations, time_limit, workers, seed, policy=policy)
+        else:
+            result = mcts.run_mcts(white, black, iterations, time_limit, workers, seed, policy=policy)
+
+        stats = {bitboard.square_to_position(square): counts
+                 for square, counts in sorted(result.stats.items()) if square is not None}
+        move = None if result.move is None else bitboard.square_to_position(result.move)
+        return mcts.MCTSResult(move, stats, result.iterations)
+
+    def enable_move_hints(self, iterations=mcts.DEFAULT_ITERATIONS, time_limit=None, workers=1,
+                          policy="random"):
+        """takes the mcts_move budget, workers and rollout policy as parameters; from now on an
+        invalid play_game also runs mcts_move and prints its statistics after the valid moves,
+        or adds them to the MoveResult as move_stats"""
+        self.check_standard_size("enable_move_hints")
+        self._move_hints = {"iterations": iterations, "time_limit": time_limit,
+                            "workers": workers, "policy": policy}
+
+    def disable_move_hints(self):
+        """stops play_game from running mcts_move after an invalid move"""
+        self._move_hints = None
+
+    def solve_endgame(self, color, workers=1):
+        """takes color to move and optional number of worker processes (all cores when None) as
+        parameters; solves the rest of the game exactly; returns tuple of player's final piece
+        count minus opponent's under perfect play and list of (color, position) moves reaching
+        it, passes left out; raises ValueError when more than endgame.MAX_EMPTIES squares are
+        empty"""
+        self.check_standard_size("solve_endgame")
+        black, white = self.get_bitboards()
+        if 64 - bitboard.popcount(black | white) > endgame.MAX_EMPTIES:
+            raise ValueError("solve_endgame needs %d or fewer empty squares" % endgame.MAX_EMPTIES)
 
-                    if self.validate_right_up(position) is True:
-                        if position not in self._white_available_positions:
-                            self._white_available_positions.append(position)
+        if color == "black":
+            result = endgame.solve(black, white, workers)
+        else:
+            result = endgame.solve(white, black, workers)
+
+        moves = []
+        mover, waiting = color, ("white" if color == "black" else "black")
+        for square in result.squares:
+            if square is not None:
+                moves.append((mover, bitboard.square_to_position(square)))
+            mover, waiting = waiting, mover
+
+        return result.score, moves
+
+
+BOARD_SLOT = Othello._board  # slot descriptor, reads self._board without calling __getattr__
+
+
+class BitboardOthello(Othello):
+    """Othello game played on two integers, one per color, instead of the list of lists board;
+    64-bit for the standard 8x8 board, size * size bits for the others. Created by
+    Othello(engine="bitboard"). Move generation, captures and piece counts use the shift and
+    mask helpers of the board's bitboard.Geometry; self._board is built from the bitboards the first
+    time it is read and then kept up to date cell by cell on every move and undo, so
+    print_board, get_board and self._board[row][col] still work. A game played only through
+    play_game never builds it and stays at its bitboards, under 1 KB idle on the standard board;
+    reading the board in any way, make_move included, keeps the list board for the rest of the
+    game, about 1.1 KB more"""
+
+    __slots__ = ("_black_move_bits", "_white_move_bits")
+
+    def start_board(self):
+        """helper function for __init__; leaves self._board to be built by __getattr__ the
+        first time it is read and the legal moves to be generated from the bitboards when first
+        needed; does not return anything"""
+        self._black_move_bits = None
+        self._white_move_bits = None
+        self._black_moves = None  # legal moves come from the bitboards instead
+        self._white_moves = None
+
+    def __getattr__(self, name):
+        """only called when an attribute is missing; builds self._board from the bitboards the
+        first time it is read"""
+        if name == "_board":
+            self._board = self._geometry.to_board(self._black_bits, self._white_bits)
+            return self._board
+
+        raise AttributeError(name)
+
+    def patch_board(self, squares, symbol):
+        """helper function for place_piece and undo_move; takes iterable of bit indexes and the
+        symbol they now hold as parameters; writes the symbol into self._board if it has been
+        built, leaving it unbuilt otherwise; does not return anything"""
+        try:
+            board = BOARD_SLOT.__get__(self)  # reading self._board would build it
+        except AttributeError:
+            return
 
-                    if self.validate_right_down(position) is True:
-                        if position not in self._white_available_positions:
-                            self._white_available_positions.append(position)
+        size = self._geometry.size
+        for square in squares:
+            row, col = divmod(square, size)
+            board[row + 1][col + 1] = symbol
+
+    def flip_board(self, color, positions):
+        """helper function for flip_pieces; takes player color and list of flipped positions as
+        parameters; writes them into self._board if it has been built and leaves the legal moves
+        to be generated again; does not return anything"""
+        self.patch_board((self._geometry.position_to_square(position) for position in positions),
+                         "X" if color == "black" else "O")
+        self._black_move_bits = None
+        self._white_move_bits = None
+
+    def find_captures(self, player_color, piece_position):
+        """helper function for play_game; takes player color and piece position as parameters;
+        returns bitboard of opponent pieces the move would capture, 0 if the position is off the
+        board, already taken, or captures nothing"""
+        square = self._geometry.position_to_square(piece_position)
+        if square is None:
+            return 0
 
-                    if self.validate_left_up(position) is True:
-                        if position not in self._white_available_positions:
-                            self._white_available_positions.append(position)
+        if player_color == "black":
+            player, opponent = self._black_bits, self._white_bits
+        else:
+            player, opponent = self._white_bits, self._black_bits
 
-                    if self.validate_left_down(position) is True:
-                        if position not in self._white_available_positions:
-                            self._white_available_positions.append(position)
+        if (player | opponent) >> square & 1:  # position already taken
+            return 0
 
-                    col += 1
+        return self._geometry.flips(player, opponent, square)
 
-                row += 1
+    def compute_flips(self, color, piece_position):
+        """takes player color and board position as parameters; returns list of every opponent
+        piece the move would flip, empty if the move is invalid"""
+        return self._geometry.positions(self.find_captures(color, piece_position))
 
-            return self._white_available_positions
+    def captured_positions(self, captures):
+        """takes bitboard of captured pieces as a parameter; returns list of their positions"""
+        return self._geometry.positions(captures)
 
-    def check_end(self, color, opponent_color):
-        """ helper function for play_game; determines if board has any open spots;
-        if no open spots on board, returns winner; if open spots, returns none;
-        called by play_game after each turn"""
-
-        self.return_available_positions(opponent_color)  # first check if opponent has moves
-
-        if opponent_color == "white":
-            if not self._white_available_positions:  # no valid moves for opponent
-                self.return_available_positions(color)  # check if player has valid moves
-                if not self._black_available_positions:  # if no valid moves
-                    self._end = True  # reached end of game
-                else:
-                    return
-            else:
-                return
-
-        if opponent_color == "black":
-            if not self._black_available_positions:  # no valid moves for opponent
-                self.return_available_positions(color)  # check if player has valid moves
-                if not self._white_available_positions:  # if no valid moves
-                    self._end = True  # reached end of game
-                else:
-                    return
-            else:
-                return
+    def place_piece(self, player_color, piece_position, captures):
+        """helper function for play_game and make_move; takes player color, piece position and
+        bitboard of captured pieces as parameters; places the piece, flips captured pieces,
+        updates piece counts and the cells of self._board that changed, if it has been built;
+        does not return anything"""
+        self._undo_stack.append((player_color, piece_position, captures, self._black_pieces,
+                                 self._white_pieces, self._hash, self._to_move, self._end,
+                                 self._winning_color, self._frontier, self._stable,
+                                 self._full_lines))
+        placed = 1 << self._geometry.position_to_square(piece_position)
 
-        if self._end is True:
-            if self._black_pieces > self._white_pieces:
-                self._winning_color = "black"
+        if player_color == "black":
+            self._black_bits |= placed | captures
+            self._white_bits &= ~(placed | captures)
+        else:
+            self._white_bits |= placed | captures
+            self._black_bits &= ~(placed | captures)
+
+        self._black_pieces = bitboard.popcount(self._black_bits)
+        self._white_pieces = bitboard.popcount(self._white_bits)
+        self.update_hash(player_color, placed.bit_length() - 1, bitboard.squares(captures))
+        self.update_features(placed.bit_length() - 1)
+        self._black_move_bits = None
+        self._white_move_bits = None
+
+        symbol = "X" if player_color == "black" else "O"
+        self.patch_board(bitboard.squares(placed | captures), symbol)
+
+    def undo_move(self):
+        """takes back the last move on the bitboards, restoring piece counts, hash and end of
+        game state from before it; returns tuple of the color and position of the move taken
+        back"""
+        if not self._undo_stack:
+            raise ValueError("no move to undo")
+
+        (player_color, piece_position, captures, self._black_pieces, self._white_pieces,
+         self._hash, self._to_move, self._end, self._winning_color, self._frontier, self._stable,
+         self._full_lines) = self._undo_stack.pop()
+
+        placed = 1 << self._geometry.position_to_square(piece_position)
+        if player_color == "black":
+            self._black_bits &= ~(placed | captures)
+            self._white_bits |= captures
+        else:
+            self._white_bits &= ~(placed | captures)
+            self._black_bits |= captures
+
+        self._black_move_bits = None
+        self._white_move_bits = None
+
+        self.patch_board(bitboard.squares(captures), "O" if player_color == "black" else "X")
+        self.patch_board(bitboard.squares(placed), ".")
+
+        return player_color, piece_position
+
+    def copy_board(self, game):
+        """helper function for fork; takes the game being forked as a parameter; shares its
+        legal move bitboards, which are plain integers, and leaves the board to be built when
+        first needed; does not return anything"""
+        self._black_move_bits = game._black_move_bits
+        self._white_move_bits = game._white_move_bits
+        self._black_moves = None
+        self._white_moves = None
+
+    def __setstate__(self, state):
+        """takes state from __getstate__ as a parameter; restores the game on its bitboards,
+        leaving the board and legal moves to be built when first needed"""
+        self.restore_state(state)
+        self._black_move_bits = None
+        self._white_move_bits = None
+        self._black_moves = None
+        self._white_moves = None
 
-            if self._white_pieces > self._black_pieces:
-                self._winning_color = "white"
+    def make_move(self, color, piece_position):
+        """takes player color and board position as parameters, places player's piece and flips
+        captured pieces on the bitboards; returns self._board updated with player's move, which
+        is built on the first call and then kept, so a game driven through make_move does not
+        stay at its compact bitboard-only state; use play_game for games held idle in bulk"""
+        self.place_piece(color, piece_position, self.find_captures(color, piece_position))
+        return self._board
 
-            if self._white_pieces == self._black_pieces:
-                self._winning_color = "tie"
+    def count_moves(self, color):
+        """takes player color as a parameter; returns number of legal moves for player from the
+        bitboard move generation"""
+        return bitboard.popcount(self.legal_move_bits(color))
 
-    def return_winner(self):
-        """helper function for play_game; called by play_game at end of game; returns
-        string with winner color and name; if tied, returns string stating there was a tie"""
-        if self._winning_color == "tie":
-            return "It's a tie"
+    def legal_move_bits(self, color):
+        """takes player color as a parameter; returns bitboard of player's legal moves, running
+        move generation at most once per color after each move"""
+        legal_moves = self._geometry.legal_moves
+        if color == "black":
+            if self._black_move_bits is None:
+                self._black_move_bits = legal_moves(self._black_bits, self._white_bits)
+            return self._black_move_bits
 
-        for player in self._player_list:
-            color = player.get_color()
+        if self._white_move_bits is None:
+            self._white_move_bits = legal_moves(self._white_bits, self._black_bits)
+        return self._white_move_bits
 
-            if color == self._winning_color:
-                name = player.get_name()
-                winner = "Winner is " + color + " player: " + name
-                return winner
+    def return_available_positions(self, color):
+        """takes player color as a parameter; returns list of available positions for player,
+        found with bitboard move generation instead of validating every cell"""
+        if color == "black":
+            self._black_available_positions = self._geometry.positions(self.legal_move_bits(color))
+            return self._black_available_positions
+
+        if color == "white":
+            self._white_available_positions = self._geometry.positions(self.legal_move_bits(color))
+            return self._white_available_positions
+
+    def has_available_positions(self, color):
+        """helper function for check_end; takes player color as a parameter; returns true if
+        player has at least one legal move on the bitboards, false otherwise"""
+        return self.legal_move_bits(color) != 0
 
 
 def main():
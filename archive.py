@@ -0,0 +1,171 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Compact binary archive of finished Othello games. Each record is a four byte
+# header (lengths of the two player names, result, number of moves), the UTF-8 player names
+# and one byte per move holding its bit index; passes are not stored since replaying the game
+# shows when a color has no move. GameArchiveWriter appends records to a file, read_records
+# streams them back one at a time through a buffered reader, and replay_records replays each
+# record through the Othello move rules, so an archive of any size is processed in constant
+# memory.
+
+import argparse
+import collections
+import json
+
+import bitboard
+from Othello import Othello
+
+MAGIC = b"OTHGAMES"
+RESULTS = ("black", "white", "tie", None)  # result byte -> winning color, None if unfinished
+READ_BUFFER = 1 << 20
+
+GameRecord = collections.namedtuple("GameRecord", ["black_name", "white_name", "winner", "moves"])
+
+
+def encode_name(name):
+    """takes a player name or None as a parameter; returns it as UTF-8, cut to the 255 bytes a
+    record can hold without splitting a character"""
+    return (name or "").encode("utf-8")[:255].decode("utf-8", "ignore").encode("utf-8")
+
+
+class GameArchiveWriter:
+    """Appends game records to an archive file, writing the file header when the file is new"""
+
+    def __init__(self, path):
+        """takes file path as a parameter; opens it for appending; raises ValueError if the
+        file exists and is not a game archive"""
+        self._file = open(path, "ab")
+
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        else:
+            with open(path, "rb") as existing:
+                if existing.read(len(MAGIC)) != MAGIC:
+                    self._file.close()
+                    raise ValueError("not a game archive: %s" % path)
+
+    def write(self, black_name, white_name, winner, moves):
+        """takes player names, winning color ("black", "white", "tie" or None) and list of
+        (row, col) moves, passes left out, as parameters; appends one record; does not return
+        anything; raises ValueError, writing nothing, if a move is off the 8x8 board"""
+        black = encode_name(black_name)
+        white = encode_name(white_name)
+        squares = []
+        for position in moves:
+            square = bitboard.position_to_square(position)
+            if square is None:
+                raise ValueError("move %s is not on the 8x8 board" % (position,))
+            squares.append(square)
+        squares = bytes(squares)
+
+        self._file.write(bytes((len(black), len(white), RESULTS.index(winner), len(squares))))
+        self._file.write(black + white + squares)
+
+    def write_game(self, game):
+        """takes an Othello game as a parameter; appends its players' names, result and moves;
+        does not return anything; raises ValueError if the game is not played on an 8x8 board,
+        since moves are stored as 8x8 bit indexes"""
+        game.check_standard_size("archive")
+        self.write(game.get_player_name("black"), game.get_player_name("white"),
+                   game.get_winning_color(), [position for _, position in game.get_move_history()])
+
+    def close(self):
+        """closes the archive file"""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_records(path):
+    """takes file path as a parameter; generator that yields a GameRecord, with moves as bit
+    indexes, for each record in the archive, reading the file in large buffered chunks; raises
+    ValueError if the file is not a game archive or ends in the middle of a record"""
+    with open(path, "rb", buffering=READ_BUFFER) as archive:
+        if archive.read(len(MAGIC)) != MAGIC:
+            raise ValueError("not a game archive: %s" % path)
+
+        while True:
+            header = archive.read(4)
+            if not header:
+                return
+
+            if len(header) < 4:
+                raise ValueError("truncated record in %s" % path)
+
+            black_length, white_length, result, move_count = header
+            body = archive.read(black_length + white_length + move_count)
+            if len(body) < black_length + white_length + move_count:
+                raise ValueError("truncated record in %s" % path)
+
+            yield GameRecord(body[:black_length].decode("utf-8"),
+                             body[black_length:black_length + white_length].decode("utf-8"),
+                             RESULTS[result], body[black_length + white_length:])
+
+
+def replay(record, engine="bitboard"):
+    """takes a GameRecord and optional engine name as parameters; replays its moves like
+    make_move does, reusing the captures found while validating each one, passing for a color
+    with no available position, and checks for the end of the game after the last move;
+    returns the game; raises ValueError on an invalid move or a result that does not match"""
+    game = Othello(engine)
+    if record.black_name:
+        game.create_player(record.black_name, "black")
+    if record.white_name:
+        game.create_player(record.white_name, "white")
+
+    color, opponent = "black", "white"
+    for square in record.moves:
+        if not game.has_available_positions(color):
+            color, opponent = opponent, color
+
+        position = bitboard.square_to_position(square)
+        captures = game.find_captures(color, position)
+        if not captures:
+            raise ValueError("invalid move %s for %s" % (position, color))
+
+        game.place_piece(color, position, captures)
+        color, opponent = opponent, color
+
+    game.check_end(opponent, color)
+    if record.winner is not None and game.get_winning_color() != record.winner:
+        raise ValueError("recorded result %s does not match the replayed game" % record.winner)
+
+    return game
+
+
+def replay_records(path, engine="bitboard"):
+    """takes file path and optional engine name as parameters; generator that yields
+    (GameRecord, replayed Othello game) for each record in the archive"""
+    for record in read_records(path):
+        yield record, replay(record, engine)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert and replay Othello game archives.")
+    parser.add_argument("archive", help="archive file to append to or replay")
+    parser.add_argument("--append", help="JSON lines of games as written by selfplay.py --output")
+    args = parser.parse_args()
+
+    if args.append:
+        with open(args.append) as games, GameArchiveWriter(args.archive) as writer:
+            for line in games:
+                record = json.loads(line)
+                writer.write(None, None, record["winner"], [tuple(move) for move in record["moves"]])
+        return
+
+    games = 0
+    wins = {"black": 0, "white": 0, "tie": 0, None: 0}
+    for record, game in replay_records(args.archive):
+        games += 1
+        wins[game.get_winning_color()] += 1
+
+    print("games:", games, "black:", wins["black"], "white:", wins["white"], "tie:", wins["tie"])
+
+
+if __name__ == '__main__':
+    main()
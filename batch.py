@@ -0,0 +1,190 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: OthelloBatch class that plays many independent Othello games in lockstep.
+# Boards are kept as NumPy arrays of black and white bitboards, one entry per game, so legal
+# moves, captures and the end of game check run as array operations over the whole batch
+# instead of one Python loop per game. Requires NumPy.
+
+import numpy as np
+
+import bitboard
+
+BLACK = 0
+WHITE = 1
+
+# (shift, shifts toward higher bits, mask applied to the opponent's pieces) for each direction
+_DIRECTIONS = (
+    (1, True, bitboard.INNER_COLUMNS),   # right
+    (1, False, bitboard.INNER_COLUMNS),  # left
+    (8, True, bitboard.FULL),            # down
+    (8, False, bitboard.FULL),           # up
+    (9, True, bitboard.INNER_COLUMNS),   # right down
+    (7, True, bitboard.INNER_COLUMNS),   # left down
+    (7, False, bitboard.INNER_COLUMNS),  # right up
+    (9, False, bitboard.INNER_COLUMNS),  # left up
+)
+
+
+def popcount(bits):
+    """takes an array of bitboards as a parameter; returns array of the number of pieces on
+    each one"""
+    bits = np.ascontiguousarray(bits, dtype=np.uint64)
+
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bits).astype(np.int64)
+
+    # older NumPy: count the set bits of each byte from a lookup table
+    table = np.array([bin(value).count("1") for value in range(256)], dtype=np.int64)
+    return table[bits.view(np.uint8).reshape(-1, 8)].sum(axis=1)
+
+
+def flips(player, opponent, move):
+    """takes arrays of the mover's bitboards, the opponent's bitboards and single bit move
+    masks as parameters; returns array of the bitboards of opponent pieces each move flips"""
+    flipped = np.zeros_like(player)
+
+    for shift, toward_higher, mask in _DIRECTIONS:
+        inner = opponent & np.uint64(mask)
+
+        if toward_higher:
+            run = (move << np.uint64(shift)) & inner
+            for _ in range(5):
+                run |= (run << np.uint64(shift)) & inner
+            closed = ((run << np.uint64(shift)) & player) != 0
+        else:
+            run = (move >> np.uint64(shift)) & inner
+            for _ in range(5):
+                run |= (run >> np.uint64(shift)) & inner
+            closed = ((run >> np.uint64(shift)) & player) != 0
+
+        flipped |= np.where(closed, run, np.uint64(0))
+
+    return flipped
+
+
+class OthelloBatch:
+    """Represents a batch of independent Othello games stored as NumPy arrays of black and white
+    bitboards. Tracks the color to move in each game, passing automatically when that color has
+    no valid move, and marks a game as ended when neither color can move, following the same
+    rules as Othello.play_game and Othello.check_end"""
+
+    def __init__(self, games):
+        """takes number of games as a parameter; initializes every game at the starting
+        position with black to move"""
+        self._black = np.full(games, bitboard.START_BLACK, dtype=np.uint64)
+        self._white = np.full(games, bitboard.START_WHITE, dtype=np.uint64)
+        self._to_move = np.full(games, BLACK, dtype=np.int8)
+        self._end = np.zeros(games, dtype=bool)
+        self._legal = None  # legal moves for the color to move, found when first needed
+
+    def __len__(self):
+        """returns number of games in the batch"""
+        return len(self._black)
+
+    def get_to_move(self):
+        """returns array of the color to move in each game, BLACK (0) or WHITE (1)"""
+        return self._to_move
+
+    def get_bitboards(self):
+        """returns arrays of the black and white bitboards of every game"""
+        return self._black, self._white
+
+    def legal_move_masks(self):
+        """returns array of bitboards of the legal moves for the color to move in each game,
+        0 for games that have ended"""
+        if self._legal is None:
+            black_to_move = self._to_move == BLACK
+            player = np.where(black_to_move, self._black, self._white)
+            opponent = np.where(black_to_move, self._white, self._black)
+            # bitboard.legal_moves only uses shifts and masks, so it runs on whole arrays
+            self._legal = bitboard.legal_moves(player, opponent)
+            self._legal[self._end] = 0
+
+        return self._legal
+
+    def play_moves(self, squares):
+        """takes array with one bit index per game as a parameter, -1 to leave a game as it is;
+        plays each valid move for the color to move, flipping captured pieces, then passes the
+        turn and marks ended games like check_end; invalid moves are not played; returns
+        boolean array of the games whose move was played"""
+        squares = np.asarray(squares, dtype=np.int64)
+        black_to_move = self._to_move == BLACK
+        player = np.where(black_to_move, self._black, self._white)
+        opponent = np.where(black_to_move, self._white, self._black)
+
+        move = np.left_shift(np.uint64(1), np.clip(squares, 0, 63).astype(np.uint64))
+        move &= self.legal_move_masks()
+        move[squares < 0] = 0
+        played = move != 0
+
+        flipped = flips(player, opponent, move)
+        player = player | move | flipped
+        opponent = opponent & ~flipped
+
+        self._black = np.where(black_to_move, player, opponent)
+        self._white = np.where(black_to_move, opponent, player)
+
+        # opponent moves next if they can, otherwise the player goes again, otherwise game ends
+        opponent_can_move = bitboard.legal_moves(opponent, player) != 0
+        player_can_move = bitboard.legal_moves(player, opponent) != 0
+        self._to_move = np.where(played & opponent_can_move, 1 - self._to_move, self._to_move)
+        self._to_move = self._to_move.astype(np.int8)
+        self._end |= played & ~opponent_can_move & ~player_can_move
+        self._legal = None
+
+        return played
+
+    def random_moves(self, rng):
+        """takes a numpy.random.Generator as a parameter; returns array with a uniformly chosen
+        legal move (bit index) for each game, -1 for games that have ended"""
+        legal = self.legal_move_masks()
+        counts = popcount(legal)
+        pick = np.floor(rng.random(len(legal)) * counts).astype(np.int64)
+        chosen = np.full(len(legal), -1, dtype=np.int64)
+        seen = np.zeros(len(legal), dtype=np.int64)
+
+        # walk the squares in order, taking the pick-th legal one in each game
+        for square in range(64):
+            is_legal = ((legal >> np.uint64(square)) & np.uint64(1)).astype(bool)
+            chosen[is_legal & (seen == pick)] = square
+            seen += is_legal
+
+        return chosen
+
+    def game_over(self):
+        """returns boolean array of the games that have ended"""
+        return self._end
+
+    def piece_counts(self):
+        """returns arrays of the number of black pieces and white pieces in each game"""
+        return popcount(self._black), popcount(self._white)
+
+    def winners(self):
+        """returns array with "black", "white" or "tie" for each ended game, following the piece
+        counts check_end uses, and None for games still in play"""
+        black_pieces, white_pieces = self.piece_counts()
+        result = np.full(len(self), None, dtype=object)
+        result[self._end & (black_pieces > white_pieces)] = "black"
+        result[self._end & (white_pieces > black_pieces)] = "white"
+        result[self._end & (white_pieces == black_pieces)] = "tie"
+        return result
+
+    def return_available_positions(self, game, color=None):
+        """takes game index and optional player color as parameters; returns list of available
+        positions in that game in the same order as Othello.return_available_positions, for the
+        color to move when color is not given"""
+        if color is None or color == ("black", "white")[self._to_move[game]]:
+            return bitboard.positions(int(self.legal_move_masks()[game]))
+
+        black = int(self._black[game])
+        white = int(self._white[game])
+        if color == "black":
+            return bitboard.positions(bitboard.legal_moves(black, white))
+
+        return bitboard.positions(bitboard.legal_moves(white, black))
+
+    def get_board(self, game):
+        """takes game index as a parameter; returns that game's board as the 10x10 list of lists
+        Othello.make_move returns"""
+        return bitboard.to_board(int(self._black[game]), int(self._white[game]))
@@ -0,0 +1,291 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Benchmarks for the Othello game. Perft counts the positions reached after N
+# plies from the starting position and from a few midgame positions, played through
+# make_move and undo_move, and checks them against known counts and a plain bitboard
+# reference. Timed micro benchmarks cover play_game, make_move, return_available_positions
+# and check_end, and a macro benchmark measures full random games per second. Results are
+# written as JSON and can be compared against a stored baseline, exiting with an error when
+# perft counts change or timings regress past the tolerance.
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import time
+
+import bitboard
+import selfplay
+from Othello import Othello
+
+# perft counts from the starting position, a pass counting as a ply
+START_PERFT = {1: 4, 2: 12, 3: 56, 4: 244, 5: 1396, 6: 8200, 7: 55092, 8: 390216, 9: 3005288}
+
+# (name, seed, plies) of the midgame positions: plies random moves from the start
+MIDGAME_POSITIONS = (("midgame-a", 1, 20), ("midgame-b", 2, 24), ("midgame-c", 3, 30))
+
+
+def opponent_of(color):
+    """takes player color as a parameter; returns the other color"""
+    return "white" if color == "black" else "black"
+
+
+def random_game(seed, engine="list", plies=None):
+    """takes seed, engine name and optional number of plies as parameters; plays random moves
+    from the starting position until the game ends or plies moves are made; returns the game,
+    the color to move and list of (color, position) moves played"""
+    rng = random.Random(seed)
+    game = Othello(engine)
+    color = "black"
+    moves = []
+
+    while game.get_winning_color() is None and (plies is None or len(moves) < plies):
+        position = rng.choice(game.return_available_positions(color))
+        game.make_move(color, position)
+        moves.append((color, position))
+
+        game.check_end(color, opponent_of(color))
+        if game.has_available_positions(opponent_of(color)):
+            color = opponent_of(color)
+
+    return game, color, moves
+
+
+def perft(game, color, depth, passed=False):
+    """takes game, color to move and depth as parameters; returns number of positions reached
+    after depth plies, trying each move with make_move and taking it back with undo_move; a
+    color with no move passes, and a position where neither color can move counts as one"""
+    if depth == 0:
+        return 1
+
+    positions = game.return_available_positions(color)
+    if not positions:
+        if passed:
+            return 1
+        return perft(game, opponent_of(color), depth - 1, True)
+
+    nodes = 0
+    for position in list(positions):
+        game.make_move(color, position)
+        nodes += perft(game, opponent_of(color), depth - 1)
+        game.undo_move()
+
+    return nodes
+
+
+def reference_perft(player, opponent, depth, passed=False):
+    """takes the bitboards of the player to move and of the opponent and depth as parameters;
+    returns the same count as perft using the bitboard helpers directly"""
+    if depth == 0:
+        return 1
+
+    moves = bitboard.legal_moves(player, opponent)
+    if not moves:
+        if passed:
+            return 1
+        return reference_perft(opponent, player, depth - 1, True)
+
+    nodes = 0
+    for square in bitboard.squares(moves):
+        flipped = bitboard.flips(player, opponent, square)
+        nodes += reference_perft(opponent & ~flipped, player | flipped | (1 << square), depth - 1)
+
+    return nodes
+
+
+def run_perft(engine, start_depth, midgame_depth):
+    """takes engine name and depths for the starting and midgame positions as parameters;
+    returns dictionary of position name to depth, nodes, expected nodes, seconds and whether
+    the count is correct"""
+    results = {}
+    expected = START_PERFT.get(start_depth)
+    if expected is None:  # deeper than the table of published counts
+        expected = reference_perft(bitboard.START_BLACK, bitboard.START_WHITE, start_depth)
+    cases = [("start", Othello(engine), "black", start_depth, expected)]
+
+    for name, seed, plies in MIDGAME_POSITIONS:
+        game, color, _ = random_game(seed, engine, plies)
+        black, white = game.get_bitboards()
+        player, opponent = (black, white) if color == "black" else (white, black)
+        cases.append((name, game, color, midgame_depth, reference_perft(player, opponent, midgame_depth)))
+
+    for name, game, color, depth, expected in cases:
+        start = time.perf_counter()
+        nodes = perft(game, color, depth)
+        seconds = time.perf_counter() - start
+        results[name] = {"depth": depth, "nodes": nodes, "expected": expected,
+                         "seconds": seconds, "correct": nodes == expected}
+
+    return results
+
+
+def time_calls(function, calls, repeat):
+    """takes a function that makes calls timed calls, number of calls and number of repeats as
+    parameters; returns dictionary with calls and the best seconds per call of the repeats"""
+    best = None
+
+    for _ in range(repeat):
+        elapsed = function()
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return {"calls": calls, "seconds_per_call": best / calls}
+
+
+def run_micro(engine, games, repeat):
+    """takes engine name, number of recorded games to replay and number of repeats as
+    parameters; times play_game, make_move, return_available_positions and check_end while
+    replaying the same random games; returns dictionary of benchmark name to timing"""
+    recorded = [random_game(seed, engine)[2] for seed in range(games)]
+    total_moves = sum(len(moves) for moves in recorded)
+
+    def replay_make_move():
+        elapsed = 0.0
+        for moves in recorded:
+            game = Othello(engine)
+            for color, position in moves:
+                start = time.perf_counter()
+                game.make_move(color, position)
+                elapsed += time.perf_counter() - start
+        return elapsed
+
+    def replay_play_game():
+        elapsed = 0.0
+        with contextlib.redirect_stdout(io.StringIO()):
+            for moves in recorded:
+                game = Othello(engine)
+                for color, position in moves:
+                    start = time.perf_counter()
+                    game.play_game(color, position)
+                    elapsed += time.perf_counter() - start
+        return elapsed
+
+    def replay_available_positions():
+        elapsed = 0.0
+        for moves in recorded:
+            game = Othello(engine)
+            for color, position in moves:
+                start = time.perf_counter()
+                game.return_available_positions(color)
+                elapsed += time.perf_counter() - start
+                game.make_move(color, position)
+        return elapsed
+
+    def replay_check_end():
+        elapsed = 0.0
+        for moves in recorded:
+            game = Othello(engine)
+            for color, position in moves:
+                game.make_move(color, position)
+                start = time.perf_counter()
+                game.check_end(color, opponent_of(color))
+                elapsed += time.perf_counter() - start
+        return elapsed
+
+    return {
+        "play_game": time_calls(replay_play_game, total_moves, repeat),
+        "make_move": time_calls(replay_make_move, total_moves, repeat),
+        "return_available_positions": time_calls(replay_available_positions, total_moves, repeat),
+        "check_end": time_calls(replay_check_end, total_moves, repeat),
+    }
+
+
+def run_macro(engine, games):
+    """takes engine name and number of games as parameters; plays that many random games in
+    this process; returns dictionary with games and games per second"""
+    rng = random.Random(0)
+    start = time.perf_counter()
+
+    for _ in range(games):
+        selfplay.play_random_game(rng, engine)
+
+    return {"games": games, "games_per_second": games / (time.perf_counter() - start)}
+
+
+def run_benchmarks(engine="list", start_depth=6, midgame_depth=4, micro_games=20, repeat=3,
+                   macro_games=200):
+    """takes engine name, perft depths, games replayed by the micro benchmarks, repeats and
+    games played by the macro benchmark as parameters; returns dictionary of all results"""
+    return {
+        "engine": engine,
+        "python": platform.python_version(),
+        "perft": run_perft(engine, start_depth, midgame_depth),
+        "micro": run_micro(engine, micro_games, repeat),
+        "macro": run_macro(engine, macro_games),
+    }
+
+
+def compare(results, baseline, tolerance=0.10):
+    """takes results, baseline results and allowed slowdown as a fraction as parameters;
+    returns list of strings describing each perft mismatch and each timing more than tolerance
+    slower than the baseline, empty when nothing regressed"""
+    problems = []
+
+    for name, result in results["perft"].items():
+        if not result["correct"]:
+            problems.append("perft %s: %d nodes, expected %s" % (name, result["nodes"], result["expected"]))
+
+        stored = baseline.get("perft", {}).get(name)
+        if stored is not None and stored["depth"] == result["depth"] and stored["nodes"] != result["nodes"]:
+            problems.append("perft %s: %d nodes, baseline %d" % (name, result["nodes"], stored["nodes"]))
+
+    for name, result in results["micro"].items():
+        stored = baseline.get("micro", {}).get(name)
+        if stored is not None and result["seconds_per_call"] > stored["seconds_per_call"] * (1 + tolerance):
+            problems.append("%s: %.2f us per call, baseline %.2f us" % (
+                name, result["seconds_per_call"] * 1e6, stored["seconds_per_call"] * 1e6))
+
+    stored = baseline.get("macro")
+    if stored is not None and results["macro"]["games_per_second"] < stored["games_per_second"] / (1 + tolerance):
+        problems.append("games/sec: %.1f, baseline %.1f" % (
+            results["macro"]["games_per_second"], stored["games_per_second"]))
+
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Othello move generator and game.")
+    parser.add_argument("--engine", choices=("list", "bitboard"), default="list")
+    parser.add_argument("--start-depth", type=int, default=6)
+    parser.add_argument("--midgame-depth", type=int, default=4)
+    parser.add_argument("--micro-games", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--macro-games", type=int, default=200)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against results stored in this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed slowdown, default 0.10")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.engine, args.start_depth, args.midgame_depth, args.micro_games,
+                             args.repeat, args.macro_games)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    for name, result in results["perft"].items():
+        print("perft %-10s depth %d: %d nodes (%s)" % (
+            name, result["depth"], result["nodes"], "ok" if result["correct"] else "WRONG"))
+    for name, result in results["micro"].items():
+        print("%-27s %.2f us per call" % (name, result["seconds_per_call"] * 1e6))
+    print("games/sec: %.1f" % results["macro"]["games_per_second"])
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as stored:
+            baseline = json.load(stored)
+
+    problems = compare(results, baseline, args.tolerance)
+    for problem in problems:
+        print("REGRESSION", problem)
+
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
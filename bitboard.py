@@ -0,0 +1,624 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Bitboard helpers for the Othello game. Each color's pieces are kept in a
+# 64-bit integer where bit (row - 1) * 8 + (col - 1) is set when that color has a piece on
+# (row, col) of the 8x8 playing area. Move generation, flips and piece counts are done with
+# shifts, masks and popcount instead of walking the 10x10 board cell by cell. Also holds the
+# Zobrist keys used to hash positions one changed square at a time, the eight symmetries of
+# the board (rotations and reflections) done with a few masked shifts per transform, and the
+# builders of the neighbour and line tables Geometry uses to keep frontier and stable discs up
+# to date move by move.
+# Geometry holds the same helpers for any even board size from 6 to 16; there a bitboard is a
+# size * size bit Python integer and bit (row - 1) * size + (col - 1) stands for (row, col).
+
+import random
+
+FULL = 0xFFFFFFFFFFFFFFFF
+INNER_COLUMNS = 0x7E7E7E7E7E7E7E7E  # every column except column 1 and column 8
+
+START_BLACK = (1 << 28) | (1 << 35)  # (4, 5) and (5, 4)
+START_WHITE = (1 << 27) | (1 << 36)  # (4, 4) and (5, 5)
+
+# (row step, col step) for each of the eight directions
+DIRECTIONS = ((0, 1), (0, -1), (-1, 0), (1, 0), (-1, 1), (1, 1), (-1, -1), (1, -1))
+
+
+def position_to_square(piece_position):
+    """takes a (row, col) board position as a parameter; returns its bit index, or None if
+    the position is not on the 8x8 playing area"""
+    row = piece_position[0]
+    col = piece_position[1]
+
+    if 1 <= row <= 8 and 1 <= col <= 8:
+        return (row - 1) * 8 + (col - 1)
+
+    return None
+
+
+def square_to_position(square):
+    """takes a bit index as a parameter; returns the matching (row, col) board position"""
+    return SQUARE_POSITIONS[square]
+
+
+SQUARE_POSITIONS = tuple((square // 8 + 1, square % 8 + 1) for square in range(64))
+
+
+def _build_rays():
+    """builds, for every square, the masks of the squares reached by walking in each
+    direction until the edge; rays that walk toward higher bit indexes are kept apart from
+    rays that walk toward lower bit indexes so flips can find the first blocker with a
+    single bit trick; returns both tables"""
+    forward = []
+    backward = []
+
+    for square in range(64):
+        row, col = SQUARE_POSITIONS[square]
+        square_forward = []
+        square_backward = []
+
+        for row_step, col_step in DIRECTIONS:
+            ray = 0
+            next_row = row + row_step
+            next_col = col + col_step
+
+            while 1 <= next_row <= 8 and 1 <= next_col <= 8:
+                ray |= 1 << ((next_row - 1) * 8 + (next_col - 1))
+                next_row += row_step
+                next_col += col_step
+
+            if not ray:
+                continue
+
+            if row_step * 8 + col_step > 0:
+                square_forward.append(ray)
+            else:
+                square_backward.append(ray)
+
+        forward.append(tuple(square_forward))
+        backward.append(tuple(square_backward))
+
+    return tuple(forward), tuple(backward)
+
+
+FORWARD_RAYS, BACKWARD_RAYS = _build_rays()
+
+
+def _build_zobrist_keys(cells=64, seed=0x07E110):
+    """builds a random 64-bit key for a black piece and for a white piece on every one of cells
+    squares, and one for white to move, from a fixed seed so hashes match across processes and
+    runs; returns the black keys, white keys and side to move key"""
+    rng = random.Random(seed)
+    black = tuple(rng.getrandbits(64) for _ in range(cells))
+    white = tuple(rng.getrandbits(64) for _ in range(cells))
+    return black, white, rng.getrandbits(64)
+
+
+ZOBRIST_BLACK, ZOBRIST_WHITE, ZOBRIST_WHITE_TO_MOVE = _build_zobrist_keys()
+# flipping a piece swaps its black key for its white key, a single XOR with this key
+ZOBRIST_FLIP = tuple(black ^ white for black, white in zip(ZOBRIST_BLACK, ZOBRIST_WHITE))
+
+
+def zobrist_hash(black, white, white_to_move=False):
+    """takes black and white bitboards and whether white is to move as parameters; returns the
+    Zobrist hash of the position computed from scratch"""
+    result = ZOBRIST_WHITE_TO_MOVE if white_to_move else 0
+
+    for bits, keys in ((black, ZOBRIST_BLACK), (white, ZOBRIST_WHITE)):
+        while bits:
+            lowest = bits & -bits
+            result ^= keys[lowest.bit_length() - 1]
+            bits ^= lowest
+
+    return result
+
+
+def popcount(bits):
+    """takes a bitboard as a parameter; returns number of pieces on it"""
+    return bits.bit_count()
+
+
+def legal_moves(player, opponent):
+    """takes the bitboards of the player to move and of the opponent as parameters;
+    returns a bitboard of every empty square where the player can capture"""
+    empty = ~(player | opponent) & FULL
+    inner = opponent & INNER_COLUMNS  # stops horizontal and diagonal runs wrapping rows
+    moves = 0
+
+    # right
+    line = (player << 1) & inner
+    line |= (line << 1) & inner
+    line |= (line << 1) & inner
+    line |= (line << 1) & inner
+    line |= (line << 1) & inner
+    line |= (line << 1) & inner
+    moves |= line << 1
+
+    # left
+    line = (player >> 1) & inner
+    line |= (line >> 1) & inner
+    line |= (line >> 1) & inner
+    line |= (line >> 1) & inner
+    line |= (line >> 1) & inner
+    line |= (line >> 1) & inner
+    moves |= line >> 1
+
+    # down
+    line = (player << 8) & opponent
+    line |= (line << 8) & opponent
+    line |= (line << 8) & opponent
+    line |= (line << 8) & opponent
+    line |= (line << 8) & opponent
+    line |= (line << 8) & opponent
+    moves |= line << 8
+
+    # up
+    line = (player >> 8) & opponent
+    line |= (line >> 8) & opponent
+    line |= (line >> 8) & opponent
+    line |= (line >> 8) & opponent
+    line |= (line >> 8) & opponent
+    line |= (line >> 8) & opponent
+    moves |= line >> 8
+
+    # right down
+    line = (player << 9) & inner
+    line |= (line << 9) & inner
+    line |= (line << 9) & inner
+    line |= (line << 9) & inner
+    line |= (line << 9) & inner
+    line |= (line << 9) & inner
+    moves |= line << 9
+
+    # left down
+    line = (player << 7) & inner
+    line |= (line << 7) & inner
+    line |= (line << 7) & inner
+    line |= (line << 7) & inner
+    line |= (line << 7) & inner
+    line |= (line << 7) & inner
+    moves |= line << 7
+
+    # right up
+    line = (player >> 7) & inner
+    line |= (line >> 7) & inner
+    line |= (line >> 7) & inner
+    line |= (line >> 7) & inner
+    line |= (line >> 7) & inner
+    line |= (line >> 7) & inner
+    moves |= line >> 7
+
+    # left up
+    line = (player >> 9) & inner
+    line |= (line >> 9) & inner
+    line |= (line >> 9) & inner
+    line |= (line >> 9) & inner
+    line |= (line >> 9) & inner
+    line |= (line >> 9) & inner
+    moves |= line >> 9
+
+    return moves & empty
+
+
+def flips(player, opponent, square):
+    """takes the bitboards of the player to move and of the opponent and the bit index of
+    an empty square as parameters; returns a bitboard of the opponent pieces captured by
+    playing there, which is 0 when the move is invalid"""
+    flipped = 0
+    not_opponent = ~opponent
+
+    for ray in FORWARD_RAYS[square]:
+        blockers = ray & not_opponent
+        first = blockers & -blockers  # nearest square that is not the opponent's
+        if first & player:
+            flipped |= ray & (first - 1)
+
+    for ray in BACKWARD_RAYS[square]:
+        blockers = ray & not_opponent
+        if blockers:
+            first = 1 << (blockers.bit_length() - 1)
+            if first & player:
+                flipped |= ray & -(first << 1)
+
+    return flipped
+
+
+def positions(bits):
+    """takes a bitboard as a parameter; returns list of (row, col) positions of its set bits
+    in the same row by row order return_available_positions scans the board"""
+    result = []
+
+    while bits:
+        lowest = bits & -bits
+        result.append(SQUARE_POSITIONS[lowest.bit_length() - 1])
+        bits ^= lowest
+
+    return result
+
+
+def squares(bits):
+    """takes a bitboard as a parameter; generator that yields the bit index of each set bit
+    from lowest to highest"""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def to_board(black, white):
+    """takes black and white bitboards as parameters; returns the 10x10 list of lists board
+    with "*" edges that Othello uses for self._board"""
+    board = [["*"] * 10]
+
+    for row in range(8):
+        line = ["*"]
+        for col in range(8):
+            bit = 1 << (row * 8 + col)
+            if black & bit:
+                line.append("X")
+            elif white & bit:
+                line.append("O")
+            else:
+                line.append(".")
+        line.append("*")
+        board.append(line)
+
+    board.append(["*"] * 10)
+    return board
+
+
+def mirror_horizontal(bits):
+    """takes a bitboard as a parameter; returns it mirrored left to right, column c to 9 - c"""
+    bits = ((bits >> 1) & 0x5555555555555555) | ((bits & 0x5555555555555555) << 1)
+    bits = ((bits >> 2) & 0x3333333333333333) | ((bits & 0x3333333333333333) << 2)
+    return ((bits >> 4) & 0x0F0F0F0F0F0F0F0F) | ((bits & 0x0F0F0F0F0F0F0F0F) << 4)
+
+
+def flip_vertical(bits):
+    """takes a bitboard as a parameter; returns it flipped top to bottom, row r to 9 - r"""
+    bits = ((bits >> 8) & 0x00FF00FF00FF00FF) | ((bits & 0x00FF00FF00FF00FF) << 8)
+    bits = ((bits >> 16) & 0x0000FFFF0000FFFF) | ((bits & 0x0000FFFF0000FFFF) << 16)
+    return (bits >> 32) | ((bits & 0x00000000FFFFFFFF) << 32)
+
+
+def flip_diagonal(bits):
+    """takes a bitboard as a parameter; returns it reflected in the (1, 1) to (8, 8) diagonal,
+    (row, col) to (col, row)"""
+    swap = 0x0F0F0F0F00000000 & (bits ^ (bits << 28))
+    bits ^= swap ^ (swap >> 28)
+    swap = 0x3333000033330000 & (bits ^ (bits << 14))
+    bits ^= swap ^ (swap >> 14)
+    swap = 0x5500550055005500 & (bits ^ (bits << 7))
+    return bits ^ swap ^ (swap >> 7)
+
+
+# symmetry numbers 0 to 7: bit 1 mirrors left to right, then bit 2 flips top to bottom, then bit
+# 4 reflects in the diagonal; 0 is the identity
+SYMMETRIES = range(8)
+
+
+def transform(bits, symmetry):
+    """takes a bitboard and symmetry number as parameters; returns the transformed bitboard"""
+    if symmetry & 1:
+        bits = mirror_horizontal(bits)
+    if symmetry & 2:
+        bits = flip_vertical(bits)
+    if symmetry & 4:
+        bits = flip_diagonal(bits)
+    return bits
+
+
+def _build_symmetry_tables():
+    """returns tuple of where each symmetry sends every square and tuple of the symmetry that
+    undoes each symmetry"""
+    square_maps = tuple(
+        tuple(transform(1 << square, symmetry).bit_length() - 1 for square in range(64))
+        for symmetry in SYMMETRIES)
+    inverses = tuple(next(other for other in SYMMETRIES
+                          if all(square_maps[other][square_maps[symmetry][square]] == square
+                                 for square in range(64)))
+                     for symmetry in SYMMETRIES)
+    return square_maps, inverses
+
+
+SYMMETRY_SQUARES, INVERSE_SYMMETRIES = _build_symmetry_tables()
+
+
+def transform_square(square, symmetry):
+    """takes bit index and symmetry number as parameters; returns the bit index the symmetry
+    moves that square to"""
+    return SYMMETRY_SQUARES[symmetry][square]
+
+
+def canonical(black, white):
+    """takes black and white bitboards as parameters; returns tuple of the black and white
+    bitboards of the smallest of the position's eight symmetric images, compared black first,
+    and the symmetry number that produces it from the given position; every position that is a
+    rotation or reflection of another gets the same canonical bitboards"""
+    best = (black, white, 0)
+
+    images = [(black, white)]
+    images.append((mirror_horizontal(black), mirror_horizontal(white)))
+    images.append((flip_vertical(black), flip_vertical(white)))
+    images.append((flip_vertical(images[1][0]), flip_vertical(images[1][1])))
+    images.extend([(flip_diagonal(image_black), flip_diagonal(image_white))
+                   for image_black, image_white in images])
+
+    for symmetry in range(1, 8):
+        image_black, image_white = images[symmetry]
+        if image_black < best[0] or (image_black == best[0] and image_white < best[1]):
+            best = (image_black, image_white, symmetry)
+
+    return best
+
+
+CORNERS = 0x8100000000000081
+COLUMN_1 = 0x0101010101010101
+COLUMN_8 = 0x8080808080808080
+BORDER = COLUMN_1 | COLUMN_8 | 0xFF000000000000FF  # columns 1 and 8, rows 1 and 8
+
+# the four lines a disc can be flipped along: horizontal, vertical and the two diagonals
+AXES = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+def _build_neighbour_masks(size=8):
+    """returns tuple of, for each square of a size x size board, the bitboard of the squares
+    next to it"""
+    masks = []
+
+    for square in range(size * size):
+        row, col = divmod(square, size)
+        mask = 0
+        for row_step, col_step in DIRECTIONS:
+            if 0 <= row + row_step < size and 0 <= col + col_step < size:
+                mask |= 1 << ((row + row_step) * size + col + col_step)
+        masks.append(mask)
+
+    return tuple(masks)
+
+
+def _build_line_masks(size=8):
+    """returns tuple of, for each square of a size x size board, tuple of the bitboard of the
+    whole line through the square along each of AXES"""
+    lines = []
+
+    for square in range(size * size):
+        row, col = divmod(square, size)
+        square_lines = []
+        for row_step, col_step in AXES:
+            mask = 1 << square
+            for sign in (1, -1):
+                next_row, next_col = row + sign * row_step, col + sign * col_step
+                while 0 <= next_row < size and 0 <= next_col < size:
+                    mask |= 1 << (next_row * size + next_col)
+                    next_row += sign * row_step
+                    next_col += sign * col_step
+            square_lines.append(mask)
+        lines.append(tuple(square_lines))
+
+    return tuple(lines)
+
+
+def stable_discs(black, white, full_lines, stable=0):
+    """takes black and white bitboards, tuple of the bitboards of the squares whose line along
+    each of AXES is full, and discs already known to be stable as parameters; returns bitboard
+    of every disc found stable: along each axis its line is full, it sits at an end of the
+    line, or a stable disc of its own color is next to it on the line, so no move can ever flip
+    it. Stable discs stay stable, so the search can start from the last known mask and usually
+    ends in one pass"""
+    horizontal = full_lines[0] | COLUMN_1 | COLUMN_8
+    vertical = full_lines[1] | 0xFF000000000000FF
+    diagonal = full_lines[2] | BORDER
+    anti_diagonal = full_lines[3] | BORDER
+
+    while True:
+        grown = stable
+        for own in (black, white):
+            near = stable & own  # stable discs this color's discs can lean on
+            secure = horizontal | ((near << 1) & ~COLUMN_1) | ((near >> 1) & ~COLUMN_8)
+            secure &= vertical | (near << 8) | (near >> 8)
+            secure &= diagonal | ((near << 9) & ~COLUMN_1) | ((near >> 9) & ~COLUMN_8)
+            secure &= anti_diagonal | ((near << 7) & ~COLUMN_8) | ((near >> 7) & ~COLUMN_1)
+            grown |= own & secure
+
+        if grown == stable:
+            return stable
+        stable = grown
+
+
+SIZES = range(6, 17, 2)  # board sizes Geometry supports
+
+
+class Geometry:
+    """Squares, masks, starting position and Zobrist keys of a size x size board, with move
+    generation, flips and stable discs for its bitboards. The 8x8 geometry uses the unrolled
+    module functions above; other sizes run the same shifts in loops, with the direction shifts
+    and masks worked out from the size. Get one with geometry(size)"""
+
+    def __init__(self, size):
+        """takes board size as a parameter; builds the tables for that size"""
+        self.size = size
+        self.cells = size * size
+        self.full = (1 << self.cells) - 1
+        self.column_1 = sum(1 << (row * size) for row in range(size))
+        self.column_last = self.column_1 << (size - 1)
+        self.inner_columns = self.full & ~(self.column_1 | self.column_last)
+        self.edge_rows = ((1 << size) - 1) | (((1 << size) - 1) << (self.cells - size))
+        self.border = self.column_1 | self.column_last | self.edge_rows
+        self.corners = 1 | (1 << (size - 1)) | (1 << (self.cells - size)) | (1 << (self.cells - 1))
+
+        # the four middle squares: white on the main diagonal, black on the other, as on 8x8
+        middle = (size // 2 - 1) * (size + 1)  # bit index of the upper left middle square
+        self.start_white = (1 << middle) | (1 << (middle + size + 1))
+        self.start_black = (1 << (middle + 1)) | (1 << (middle + size))
+
+        self.square_positions = tuple((square // size + 1, square % size + 1)
+                                      for square in range(self.cells))
+        self.neighbours = _build_neighbour_masks(size)
+        self.lines = _build_line_masks(size)
+
+        # (shift, shifts toward higher bits, mask applied to the opponent's pieces)
+        self.directions = (
+            (1, True, self.inner_columns), (1, False, self.inner_columns),
+            (size, True, self.full), (size, False, self.full),
+            (size + 1, True, self.inner_columns), (size - 1, True, self.inner_columns),
+            (size - 1, False, self.inner_columns), (size + 1, False, self.inner_columns))
+        # doubling steps needed for a fill to cross a line of size - 2 opponent pieces
+        self.fill_steps = (size - 2).bit_length()
+
+        if size == 8:
+            self.zobrist_black, self.zobrist_white = ZOBRIST_BLACK, ZOBRIST_WHITE
+            self.zobrist_white_to_move = ZOBRIST_WHITE_TO_MOVE
+            self.legal_moves = legal_moves
+            self.flips = flips
+            self.stable_discs = stable_discs
+        else:
+            (self.zobrist_black, self.zobrist_white,
+             self.zobrist_white_to_move) = _build_zobrist_keys(self.cells, 0x07E110 + size)
+        self.zobrist_flip = tuple(black ^ white
+                                  for black, white in zip(self.zobrist_black, self.zobrist_white))
+
+    def position_to_square(self, piece_position):
+        """takes a (row, col) board position as a parameter; returns its bit index, or None if
+        the position is not on the board"""
+        row = piece_position[0]
+        col = piece_position[1]
+
+        if 1 <= row <= self.size and 1 <= col <= self.size:
+            return (row - 1) * self.size + (col - 1)
+
+        return None
+
+    def square_to_position(self, square):
+        """takes a bit index as a parameter; returns the matching (row, col) board position"""
+        return self.square_positions[square]
+
+    def positions(self, bits):
+        """takes a bitboard as a parameter; returns list of (row, col) positions of its set bits
+        in row by row order"""
+        return [self.square_positions[square] for square in squares(bits)]
+
+    def zobrist_hash(self, black, white, white_to_move=False):
+        """takes black and white bitboards and whether white is to move as parameters; returns
+        the Zobrist hash of the position computed from scratch"""
+        result = self.zobrist_white_to_move if white_to_move else 0
+
+        for square in squares(black):
+            result ^= self.zobrist_black[square]
+        for square in squares(white):
+            result ^= self.zobrist_white[square]
+
+        return result
+
+    def legal_moves(self, player, opponent):
+        """takes the bitboards of the player to move and of the opponent as parameters; returns
+        a bitboard of every empty square where the player can capture. Each direction is filled
+        from the player's pieces through the opponent's by doubling the step, so a 16x16 board
+        needs four fill steps per direction instead of thirteen one square steps"""
+        empty = ~(player | opponent) & self.full
+        moves = 0
+
+        for shift, toward_higher, mask in self.directions:
+            through = opponent & mask  # squares a line may run over
+            reached = player
+            step = shift
+
+            for _ in range(self.fill_steps):
+                if toward_higher:
+                    reached |= through & (reached << step)
+                    through &= through << step
+                else:
+                    reached |= through & (reached >> step)
+                    through &= through >> step
+                step *= 2
+
+            # the opponent pieces reached, moved one more square, land on the legal moves
+            reached &= ~player
+            if toward_higher:
+                moves |= (reached << shift) & empty
+            else:
+                moves |= (reached >> shift) & empty
+
+        return moves
+
+    def flips(self, player, opponent, square):
+        """takes the bitboards of the player to move and of the opponent and the bit index of
+        the move as parameters; returns bitboard of the opponent pieces the move flips, walking
+        each direction only as far as the run of opponent pieces goes"""
+        move = 1 << square
+        flipped = 0
+
+        for shift, toward_higher, mask in self.directions:
+            inner = opponent & mask
+            run = 0
+            step = move << shift if toward_higher else move >> shift
+
+            while step & inner:
+                run |= step
+                step = step << shift if toward_higher else step >> shift
+
+            if step & player:
+                flipped |= run
+
+        return flipped
+
+    def stable_discs(self, black, white, full_lines, stable=0):
+        """stable_discs for this board size; see the module function"""
+        horizontal = full_lines[0] | self.column_1 | self.column_last
+        vertical = full_lines[1] | self.edge_rows
+        diagonal = full_lines[2] | self.border
+        anti_diagonal = full_lines[3] | self.border
+        size = self.size
+        not_first, not_last = ~self.column_1, ~self.column_last
+        down_right, down_left = size + 1, size - 1
+
+        while True:
+            grown = stable
+            for own in (black, white):
+                near = stable & own
+                secure = horizontal | ((near << 1) & not_first) | ((near >> 1) & not_last)
+                secure &= vertical | (near << size) | (near >> size)
+                secure &= (diagonal | ((near << down_right) & not_first)
+                           | ((near >> down_right) & not_last))
+                secure &= (anti_diagonal | ((near << down_left) & not_last)
+                           | ((near >> down_left) & not_first))
+                grown |= own & secure
+
+            if grown == stable:
+                return stable
+            stable = grown
+
+    def to_board(self, black, white):
+        """takes black and white bitboards as parameters; returns the (size + 2) x (size + 2)
+        list of lists board with "*" edges that Othello uses for self._board"""
+        board = [["*"] * (self.size + 2)]
+
+        for row in range(self.size):
+            line = ["*"]
+            for col in range(self.size):
+                bit = 1 << (row * self.size + col)
+                if black & bit:
+                    line.append("X")
+                elif white & bit:
+                    line.append("O")
+                else:
+                    line.append(".")
+            line.append("*")
+            board.append(line)
+
+        board.append(["*"] * (self.size + 2))
+        return board
+
+
+_geometries = {}
+
+
+def geometry(size=8):
+    """takes board size as a parameter; returns the Geometry for that size, built the first time
+    it is asked for; raises ValueError unless size is even and from 6 to 16"""
+    if size not in _geometries:
+        if size not in SIZES:
+            raise ValueError("board size must be an even number from 6 to 16")
+        _geometries[size] = Geometry(size)
+
+    return _geometries[size]
@@ -0,0 +1,179 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Opening book for the Othello game. OpeningBookBuilder replays finished games
+# (from self-play or imported move lists) and counts, for every position of the first plies,
+# how often each move led to a win, draw or loss for the color that played it. The counts are
+# written as a binary file of fixed size records: a hash table of position slots keyed by
+# Othello.canonical_hash, so the rotations and reflections of a position share one entry whose
+# moves are stored in the canonical orientation, followed by the candidate moves of every
+# position. OpeningBook opens the file with mmap, so loading is instant, the operating system
+# pages it in as lookups touch it, and processes sharing one book share its pages. A lookup
+# probes one or two slots.
+
+import argparse
+import collections
+import json
+import mmap
+import struct
+
+import bitboard
+import selfplay
+from Othello import Othello
+
+MAGIC = b"OTHBOOK2"
+HEADER = struct.Struct("<8sIII")  # magic, number of slots, number of moves, plies covered
+SLOT = struct.Struct("<QII")  # position hash, index of first move, number of moves (0 if empty)
+MOVE = struct.Struct("<B3xIII")  # bit index of the move, wins, draws, losses
+
+BookMove = collections.namedtuple("BookMove", ["position", "wins", "draws", "losses"])
+
+
+class OpeningBookBuilder:
+    """Collects win, draw and loss counts per (position, move) from finished games and writes
+    them as an opening book file"""
+
+    def __init__(self, plies=16):
+        """takes number of plies from the start of each game to record as a parameter"""
+        self._plies = plies
+        self._counts = {}  # position hash -> {square: [wins, draws, losses]}
+
+    def add_game(self, moves, winner):
+        """takes list of (row, col) moves from the starting position, passes left out, and the
+        winning color ("black", "white" or "tie") as parameters; replays the game and counts the
+        result for each of its first plies; raises ValueError if a move is invalid"""
+        game = Othello("bitboard")
+        color, opponent = "black", "white"
+
+        for ply, position in enumerate(moves[:self._plies]):
+            if not game.has_available_positions(color):  # color passes
+                color, opponent = opponent, color
+
+            captures = game.find_captures(color, position)
+            if not captures:
+                raise ValueError("invalid move %s for %s at ply %d" % (position, color, ply))
+
+            position_hash, symmetry = game.canonical_hash()
+            counts = self._counts.setdefault(position_hash, {})
+            square = bitboard.transform_square(bitboard.position_to_square(position), symmetry)
+            result = counts.setdefault(square, [0, 0, 0])
+            if winner == "tie":
+                result[1] += 1
+            elif winner == color:
+                result[0] += 1
+            else:
+                result[2] += 1
+
+            game.place_piece(color, position, captures)
+            color, opponent = opponent, color
+
+    def write(self, path):
+        """takes file path as a parameter; writes the book with twice as many slots as positions
+        rounded up to a power of two, placing each position by linear probing; does not return
+        anything"""
+        slot_count = 1
+        while slot_count < 2 * len(self._counts):
+            slot_count *= 2
+
+        slots = [None] * slot_count
+        moves = []
+
+        for position_hash, counts in self._counts.items():
+            index = position_hash & (slot_count - 1)
+            while slots[index] is not None:
+                index = (index + 1) & (slot_count - 1)
+
+            slots[index] = (position_hash, len(moves), len(counts))
+            for square, (wins, draws, losses) in sorted(counts.items()):
+                moves.append((square, wins, draws, losses))
+
+        with open(path, "wb") as output:
+            output.write(HEADER.pack(MAGIC, slot_count, len(moves), self._plies))
+            for slot in slots:
+                output.write(SLOT.pack(*slot) if slot is not None else SLOT.pack(0, 0, 0))
+            for move in moves:
+                output.write(MOVE.pack(*move))
+
+
+class OpeningBook:
+    """Read-only opening book file mapped into memory. Lookups read records straight out of the
+    mapping with struct.unpack_from, so nothing is parsed when the book is opened"""
+
+    def __init__(self, path):
+        """takes file path as a parameter; maps the book and reads its header; raises
+        ValueError if the file is not an opening book"""
+        with open(path, "rb") as book_file:
+            self._map = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self._slot_count, self._move_count, self._plies = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError("not an opening book: %s" % path)
+
+        self._moves_offset = HEADER.size + self._slot_count * SLOT.size
+
+    def get_plies(self):
+        """returns number of plies from the start of the game the book covers"""
+        return self._plies
+
+    def lookup(self, position_hash):
+        """takes a position hash from Othello.canonical_hash as a parameter; returns list of
+        BookMove for the moves played from that position, in the canonical orientation and most
+        played first, empty if the position is not in the book"""
+        mask = self._slot_count - 1
+        index = position_hash & mask
+
+        while True:
+            stored_hash, first, count = SLOT.unpack_from(self._map, HEADER.size + index * SLOT.size)
+            if count == 0:
+                return []
+            if stored_hash == position_hash:
+                break
+            index = (index + 1) & mask
+
+        result = []
+        for number in range(first, first + count):
+            square, wins, draws, losses = MOVE.unpack_from(self._map, self._moves_offset + number * MOVE.size)
+            result.append(BookMove(bitboard.square_to_position(square), wins, draws, losses))
+
+        result.sort(key=lambda move: move.wins + move.draws + move.losses, reverse=True)
+        return result
+
+    def close(self):
+        """unmaps the book"""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build an Othello opening book.")
+    parser.add_argument("output", help="book file to write")
+    parser.add_argument("--plies", type=int, default=16)
+    parser.add_argument("--input", help="JSON lines of games as written by selfplay.py --output; "
+                                        "plays new self-play games when not given")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    builder = OpeningBookBuilder(args.plies)
+
+    if args.input:
+        with open(args.input) as games:
+            for line in games:
+                record = json.loads(line)
+                builder.add_game([tuple(move) for move in record["moves"]], record["winner"])
+    else:
+        for result in selfplay.run_selfplay(args.games, args.workers, args.seed):
+            builder.add_game(result.moves, result.winner)
+
+    builder.write(args.output)
+
+
+if __name__ == '__main__':
+    main()
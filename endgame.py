@@ -0,0 +1,220 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Exact endgame solver for the Othello game. Searches every line to the end of the
+# game with alpha-beta on the black and white bitboards and returns the final disc
+# differential under perfect play together with the moves that reach it. Moves are tried
+# fastest-first (fewest replies for the opponent), breaking ties by quadrant parity, and only
+# by parity near the very end where counting replies costs more than it saves. The root moves
+# can be split across worker processes. Used by Othello.solve_endgame.
+
+import collections
+import concurrent.futures
+import os
+
+import bitboard
+
+MAX_EMPTIES = 20  # positions with more empty squares take too long to solve exactly
+FASTEST_FIRST_EMPTIES = 5  # below this many empty squares moves are ordered by parity only
+TABLE_EMPTIES = 6  # positions with at least this many empty squares go in the transposition table
+
+# the four 4x4 corner quadrants of the board
+QUADRANTS = (0x000000000F0F0F0F, 0x00000000F0F0F0F0, 0x0F0F0F0F00000000, 0xF0F0F0F000000000)
+SQUARE_QUADRANT = tuple(
+    next(quadrant for quadrant in QUADRANTS if quadrant >> square & 1) for square in range(64))
+
+# one past the largest disc differential, so a wipe-out still falls inside the default window
+WINDOW = 65
+
+EndgameResult = collections.namedtuple("EndgameResult", ["score", "squares", "nodes"])
+
+
+class EndgameSolver:
+    """Exact alpha-beta solver over bitboards. Bounds of positions with many empty squares are
+    kept in a transposition table, which also makes walking the perfect line after the search
+    cheap"""
+
+    def __init__(self):
+        """initializes the node counter and transposition table"""
+        self._nodes = 0
+        self._table = {}  # (player, opponent) -> (lower bound, upper bound)
+
+    def solve(self, player, opponent, alpha=-WINDOW, beta=WINDOW):
+        """takes the bitboards of the player to move and of the opponent and an optional score
+        window as parameters; returns EndgameResult with the final disc differential for the
+        player to move, the squares of the perfect line (None for a pass) and nodes searched;
+        when the score falls outside the window it is only a bound and the line is empty"""
+        self._nodes = 0
+        score = self._solve(player, opponent, alpha, beta, None)
+
+        line = []
+        if alpha < score < beta:
+            line = self._line(player, opponent, score)
+
+        return EndgameResult(score, line, self._nodes)
+
+    def _solve(self, player, opponent, alpha, beta, moves):
+        """returns the score of the position for the player to move, exact when it falls inside
+        the alpha-beta window and a bound otherwise; moves is the legal move bitboard when the
+        caller already has it, otherwise None"""
+        self._nodes += 1
+        if moves is None:
+            moves = bitboard.legal_moves(player, opponent)
+
+        if not moves:
+            replies = bitboard.legal_moves(opponent, player)
+            if not replies:  # neither color can move
+                return bitboard.popcount(player) - bitboard.popcount(opponent)
+            return -self._solve(opponent, player, -beta, -alpha, replies)
+
+        original_alpha = alpha
+        stored = None
+        if bitboard.popcount(player | opponent) <= 64 - TABLE_EMPTIES:
+            stored = self._table.get((player, opponent))
+            if stored is not None:
+                lower, upper = stored
+                if lower >= beta:
+                    return lower
+                if upper <= alpha or lower == upper:
+                    return upper
+                alpha = max(alpha, lower)
+                beta = min(beta, upper)
+                original_alpha = alpha
+
+        best_score = -65
+
+        for square, flipped, replies in self._ordered(player, opponent, moves):
+            child_player = opponent & ~flipped
+            child_opponent = player | flipped | (1 << square)
+
+            if best_score == -65:
+                score = -self._solve(child_player, child_opponent, -beta, -alpha, replies)
+            else:
+                # later moves only have to be proven no better than the best so far
+                score = -self._solve(child_player, child_opponent, -alpha - 1, -alpha, replies)
+                if alpha < score < beta:
+                    score = -self._solve(child_player, child_opponent, -beta, -alpha, replies)
+
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if bitboard.popcount(player | opponent) <= 64 - TABLE_EMPTIES:
+            lower, upper = stored if stored is not None else (-64, 64)
+            if best_score <= original_alpha:
+                upper = best_score
+            elif best_score >= beta:
+                lower = best_score
+            else:
+                lower = upper = best_score
+            self._table[(player, opponent)] = (lower, upper)
+
+        return best_score
+
+    def _line(self, player, opponent, score):
+        """takes the bitboards of the player to move and of the opponent and the exact score of
+        the position as parameters; walks down the game, at each step taking the first move
+        whose reply is proven to hold the score with a null window search; returns list of the
+        squares played, None for a pass"""
+        line = []
+
+        while True:
+            moves = bitboard.legal_moves(player, opponent)
+
+            if not moves:
+                if not bitboard.legal_moves(opponent, player):
+                    return line
+                line.append(None)
+                player, opponent, score = opponent, player, -score
+                continue
+
+            for square, flipped, replies in self._ordered(player, opponent, moves):
+                child_player = opponent & ~flipped
+                child_opponent = player | flipped | (1 << square)
+
+                # no move scores more than score, so a reply of at most -score means exactly
+                if self._solve(child_player, child_opponent, -score, -score + 1, replies) <= -score:
+                    line.append(square)
+                    player, opponent, score = child_player, child_opponent, -score
+                    break
+
+    @staticmethod
+    def _ordered(player, opponent, moves):
+        """takes the bitboards of the player to move and of the opponent and the legal move
+        bitboard as parameters; returns list of (square, flipped pieces, opponent's legal moves
+        after the move or None) in search order: fewest opponent replies first, then squares in
+        quadrants with an odd number of empty squares"""
+        empty = ~(player | opponent) & bitboard.FULL
+        ordered = []
+
+        if bitboard.popcount(empty) < FASTEST_FIRST_EMPTIES:
+            for square in bitboard.squares(moves):
+                even = not bitboard.popcount(empty & SQUARE_QUADRANT[square]) & 1
+                ordered.append((even, square, bitboard.flips(player, opponent, square), None))
+        else:
+            for square in bitboard.squares(moves):
+                flipped = bitboard.flips(player, opponent, square)
+                replies = bitboard.legal_moves(opponent & ~flipped, player | flipped | (1 << square))
+                even = not bitboard.popcount(empty & SQUARE_QUADRANT[square]) & 1
+                ordered.append((bitboard.popcount(replies) * 2 + even, square, flipped, replies))
+
+        ordered.sort()
+        return [(square, flipped, replies) for _, square, flipped, replies in ordered]
+
+
+def solve_root_move(player, opponent, square, alpha=-WINDOW):
+    """worker function; takes the bitboards of the player to move and of the opponent, the bit
+    index of one root move and the score to beat as parameters; returns EndgameResult for the
+    player to move when that move is played first, exact with its line when it beats alpha
+    and an upper bound with no line otherwise"""
+    flipped = bitboard.flips(player, opponent, square)
+    child_player = opponent & ~flipped
+    child_opponent = player | flipped | (1 << square)
+    solver = EndgameSolver()
+    nodes = 0
+
+    if alpha > -WINDOW:
+        # a null window proves most moves no better than alpha cheaply
+        result = solver.solve(child_player, child_opponent, -alpha - 1, -alpha)
+        nodes += result.nodes
+        if -result.score <= alpha:
+            return EndgameResult(-result.score, [], nodes + 1)
+
+    result = solver.solve(child_player, child_opponent, -WINDOW, -alpha)
+    nodes += result.nodes
+
+    return EndgameResult(-result.score, [square] + result.squares, nodes + 1)
+
+
+def solve(player, opponent, workers=1):
+    """takes the bitboards of the player to move and of the opponent and number of worker
+    processes (all cores when None) as parameters; returns EndgameResult with the exact final
+    disc differential for the player to move, the squares of a perfect line (None for a pass)
+    and nodes searched; with more than one worker the best ordered root move is solved first
+    and the rest are then solved in parallel, each only having to prove it beats the first"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    moves = bitboard.legal_moves(player, opponent)
+    if workers == 1 or bitboard.popcount(moves) < 2:
+        return EndgameSolver().solve(player, opponent)
+
+    ordered = [square for square, _, _ in EndgameSolver._ordered(player, opponent, moves)]
+    best = solve_root_move(player, opponent, ordered[0])
+    nodes = best.nodes
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(solve_root_move, player, opponent, square, best.score)
+                   for square in ordered[1:]]
+
+        # taken in move order so ties go to the same move every run
+        for future in futures:
+            result = future.result()
+            nodes += result.nodes
+            if result.score > best.score:
+                best = result
+
+    return best._replace(nodes=nodes)
@@ -0,0 +1,219 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Pattern-based static evaluation for the Othello game. A position is scored from
+# ten pattern instances (the four edges, the four 3x3 corner regions and the two long
+# diagonals) plus mobility and parity. Every pattern instance reads its squares as a base 3
+# index (0 empty, 1 player to move, 2 opponent) and looks the score up in a table built once
+# when the module is imported. The index itself comes from per-row tables, so scoring a
+# position is a few dozen lookups with no loop over squares. evaluate_batch scores many
+# positions at once with NumPy, when it is installed.
+
+import bitboard
+
+try:
+    import numpy as np
+
+    import batch
+except ImportError:  # evaluate_batch needs NumPy, evaluate does not
+    np = None
+
+MOBILITY_WEIGHT = 5
+PARITY_WEIGHT = 4
+
+# square values of the pattern tables
+CORNER = 30
+X_SQUARE = -20  # diagonally next to an empty corner
+C_SQUARE = -4  # on the edge next to an empty corner
+STABLE_EDGE = 4  # edge disc that can never be flipped back along its edge
+ANCHORED_DIAGONAL = 3  # diagonal disc in an unbroken line from a corner of its own color
+
+
+def _square(row, col):
+    """returns bit index of a 0-based (row, col)"""
+    return row * 8 + col
+
+
+def _edge_value(cells):
+    """takes the 8 cell states of an edge from corner to corner as a parameter; returns the
+    stable edge score for the player to move: discs in an unbroken line from a corner of their
+    color, or every disc once the edge is full, count as stable; corners are left to the
+    corner patterns"""
+    stable = [False] * 8
+
+    if all(cells):
+        stable = [True] * 8
+    else:
+        for order in (range(8), range(7, -1, -1)):
+            first = None
+            for index in order:
+                if first is None:
+                    first = cells[index]
+                if cells[index] == 0 or cells[index] != first:
+                    break
+                stable[index] = True
+
+    score = 0
+    for index in range(1, 7):
+        if stable[index]:
+            score += STABLE_EDGE if cells[index] == 1 else -STABLE_EDGE
+
+    return score
+
+
+def _corner_value(cells):
+    """takes the 9 cell states of a 3x3 corner region, corner first and row by row, as a
+    parameter; returns the corner score for the player to move"""
+    corner = cells[0]
+
+    if corner == 1:
+        return CORNER
+    if corner == 2:
+        return -CORNER
+
+    score = 0
+    for index, weight in ((4, X_SQUARE), (1, C_SQUARE), (3, C_SQUARE)):
+        if cells[index] == 1:
+            score += weight
+        elif cells[index] == 2:
+            score -= weight
+
+    return score
+
+
+def _diagonal_value(cells):
+    """takes the 8 cell states of a long diagonal from corner to corner as a parameter; returns
+    the anchored diagonal score for the player to move"""
+    score = 0
+
+    for line in (cells, cells[::-1]):
+        color = line[0]
+        if color == 0:
+            continue
+        for cell in line[1:7]:
+            if cell != color:
+                break
+            score += ANCHORED_DIAGONAL if color == 1 else -ANCHORED_DIAGONAL
+
+    return score
+
+
+def _ternary_cells(index, length):
+    """returns the length cell states encoded in a base 3 pattern index"""
+    cells = []
+    for _ in range(length):
+        cells.append(index % 3)
+        index //= 3
+    return cells
+
+
+def _build_pattern_table(value, length):
+    """returns tuple of value(cells) for every base 3 index of a pattern of length squares"""
+    return tuple(value(_ternary_cells(index, length)) for index in range(3 ** length))
+
+
+EDGE_TABLE = _build_pattern_table(_edge_value, 8)
+CORNER_TABLE = _build_pattern_table(_corner_value, 9)
+DIAGONAL_TABLE = _build_pattern_table(_diagonal_value, 8)
+
+# (table, squares in pattern order) for every pattern instance
+PATTERNS = (
+    (EDGE_TABLE, tuple(_square(0, col) for col in range(8))),
+    (EDGE_TABLE, tuple(_square(7, col) for col in range(8))),
+    (EDGE_TABLE, tuple(_square(row, 0) for row in range(8))),
+    (EDGE_TABLE, tuple(_square(row, 7) for row in range(8))),
+    (CORNER_TABLE, tuple(_square(row, col) for row in range(3) for col in range(3))),
+    (CORNER_TABLE, tuple(_square(row, 7 - col) for row in range(3) for col in range(3))),
+    (CORNER_TABLE, tuple(_square(7 - row, col) for row in range(3) for col in range(3))),
+    (CORNER_TABLE, tuple(_square(7 - row, 7 - col) for row in range(3) for col in range(3))),
+    (DIAGONAL_TABLE, tuple(_square(index, index) for index in range(8))),
+    (DIAGONAL_TABLE, tuple(_square(index, 7 - index) for index in range(8))),
+)
+
+
+def _build_row_tables(squares):
+    """takes the squares of a pattern instance as a parameter; returns tuple of (shift, table)
+    for every board row the pattern touches, where table[byte] is the base 3 index the
+    pattern gets from a player whose pieces on that row are the bits of byte"""
+    row_tables = []
+
+    for row in range(8):
+        places = [(square - row * 8, 3 ** place) for place, square in enumerate(squares)
+                  if square // 8 == row]
+        if not places:
+            continue
+
+        table = tuple(sum(power for column, power in places if byte >> column & 1)
+                      for byte in range(256))
+        row_tables.append((row * 8, table))
+
+    return tuple(row_tables)
+
+
+# (pattern table, ((row shift, row table), ...)) for every pattern instance
+PATTERN_LOOKUPS = tuple((table, _build_row_tables(squares)) for table, squares in PATTERNS)
+
+
+def pattern_score(player, opponent):
+    """takes the bitboards of the player to move and of the opponent as parameters; returns the
+    sum of the pattern table scores"""
+    score = 0
+
+    for table, row_tables in PATTERN_LOOKUPS:
+        index = 0
+        for shift, row_table in row_tables:
+            index += row_table[player >> shift & 0xFF] + 2 * row_table[opponent >> shift & 0xFF]
+        score += table[index]
+
+    return score
+
+
+def evaluate(player, opponent):
+    """takes the bitboards of the player to move and of the opponent as parameters; returns the
+    static score of the position for the player to move from patterns, mobility and parity"""
+    score = pattern_score(player, opponent)
+    score += MOBILITY_WEIGHT * (bitboard.popcount(bitboard.legal_moves(player, opponent))
+                                - bitboard.popcount(bitboard.legal_moves(opponent, player)))
+
+    if bitboard.popcount(player | opponent) & 1:  # odd number of empty squares left
+        score += PARITY_WEIGHT
+
+    return score
+
+
+_batch_lookups = None  # NumPy copies of PATTERN_LOOKUPS, made on first use
+
+
+def evaluate_batch(players, opponents):
+    """takes arrays of the bitboards of the players to move and of their opponents as
+    parameters; returns array of the evaluate score of every position, computed with array
+    lookups over the whole batch; requires NumPy"""
+    global _batch_lookups
+    if np is None:
+        raise ImportError("evaluate_batch requires NumPy")
+
+    if _batch_lookups is None:
+        _batch_lookups = [
+            (np.array(table, dtype=np.int64),
+             [(np.uint64(shift), np.array(row_table, dtype=np.int64))
+              for shift, row_table in row_tables])
+            for table, row_tables in PATTERN_LOOKUPS]
+
+    players = np.asarray(players, dtype=np.uint64)
+    opponents = np.asarray(opponents, dtype=np.uint64)
+    byte = np.uint64(0xFF)
+    scores = np.zeros(len(players), dtype=np.int64)
+
+    for table, row_tables in _batch_lookups:
+        index = np.zeros(len(players), dtype=np.int64)
+        for shift, row_table in row_tables:
+            index += row_table[(players >> shift) & byte]
+            index += 2 * row_table[(opponents >> shift) & byte]
+        scores += table[index]
+
+    # bitboard.legal_moves only uses shifts and masks, so it runs on whole arrays
+    scores += MOBILITY_WEIGHT * (batch.popcount(bitboard.legal_moves(players, opponents))
+                                 - batch.popcount(bitboard.legal_moves(opponents, players)))
+    scores += PARITY_WEIGHT * (batch.popcount(players | opponents) & 1)
+
+    return scores
@@ -0,0 +1,199 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Monte Carlo tree search player for the Othello game. Each iteration walks down
+# the tree choosing children by UCT, adds one new position, plays the rest of the game out
+# with a rollout policy on the bitboards and backs the result up the tree. A color with no
+# move passes and the game ends when neither color can move, as in Othello.check_end. Runs
+# can be root-parallel: every worker process grows its own tree from the same position with
+# its own seed, and the visit and win counts of the root moves are added together.
+
+import collections
+import concurrent.futures
+import math
+import os
+import random
+import time
+
+import bitboard
+import search
+
+DEFAULT_ITERATIONS = 1000
+
+MCTSResult = collections.namedtuple("MCTSResult", ["move", "stats", "iterations"])
+
+
+def random_policy(player, opponent, moves, rng):
+    """rollout policy; takes the bitboards of the player to move and of the opponent, the legal
+    move bitboard and a random.Random as parameters; returns a uniformly chosen legal square"""
+    return rng.choice(list(bitboard.squares(moves)))
+
+
+def corner_policy(player, opponent, moves, rng):
+    """rollout policy; like random_policy, but takes a corner when one is legal and avoids the
+    squares diagonally next to corners when anything else is"""
+    if moves & search.CORNERS:
+        moves &= search.CORNERS
+    elif moves & ~search.X_SQUARES:
+        moves &= ~search.X_SQUARES
+
+    return rng.choice(list(bitboard.squares(moves)))
+
+
+POLICIES = {"random": random_policy, "corners": corner_policy}
+
+
+class Node:
+    """Position in the search tree. wins and visits are counted for the color that moved into
+    the position; square is the move that led here, None for a pass"""
+
+    __slots__ = ("player", "opponent", "square", "parent", "children", "untried", "visits", "wins")
+
+    def __init__(self, player, opponent, square=None, parent=None):
+        """takes the bitboards of the player to move and of the opponent, the move that led here
+        and the parent node as parameters"""
+        self.player = player
+        self.opponent = opponent
+        self.square = square
+        self.parent = parent
+        self.children = []
+        self.visits = 0
+        self.wins = 0.0
+
+        moves = bitboard.legal_moves(player, opponent)
+        if moves:
+            self.untried = list(bitboard.squares(moves))
+        elif bitboard.legal_moves(opponent, player):
+            self.untried = [None]  # the only way on is to pass
+        else:
+            self.untried = []  # game over
+
+    def select_child(self, exploration):
+        """takes the UCT exploration constant as a parameter; returns the child with the best
+        upper confidence bound"""
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.wins / child.visits
+                   + exploration * math.sqrt(log_visits / child.visits))
+
+    def expand(self, rng):
+        """takes a random.Random as a parameter; adds a child for one untried move, chosen at
+        random; returns the child"""
+        square = self.untried.pop(rng.randrange(len(self.untried)))
+
+        if square is None:
+            child = Node(self.opponent, self.player, None, self)
+        else:
+            flipped = bitboard.flips(self.player, self.opponent, square)
+            child = Node(self.opponent & ~flipped, self.player | flipped | (1 << square), square, self)
+
+        self.children.append(child)
+        return child
+
+
+def rollout(player, opponent, policy, rng):
+    """takes the bitboards of the player to move and of the opponent, a rollout policy and a
+    random.Random as parameters; plays the game out; returns 1 if the player to move wins,
+    0.5 for a tie and 0 for a loss"""
+    original = True  # whether player still holds the pieces of the color to move at the start
+    passed = False
+
+    while True:
+        moves = bitboard.legal_moves(player, opponent)
+
+        if not moves:
+            if passed:
+                break
+            passed = True
+        else:
+            passed = False
+            square = policy(player, opponent, moves, rng)
+            flipped = bitboard.flips(player, opponent, square)
+            player, opponent = player | flipped | (1 << square), opponent & ~flipped
+
+        player, opponent = opponent, player
+        original = not original
+
+    difference = bitboard.popcount(player) - bitboard.popcount(opponent)
+    if not original:
+        difference = -difference
+
+    if difference > 0:
+        return 1.0
+    if difference < 0:
+        return 0.0
+    return 0.5
+
+
+def search_tree(player, opponent, iterations=None, time_limit=None, seed=0, exploration=1.4,
+                policy="random"):
+    """worker function; takes the bitboards of the player to move and of the opponent, maximum
+    iterations, time limit in seconds, seed, UCT exploration constant and rollout policy name
+    as parameters; grows one tree until either budget runs out; returns tuple of dictionary of
+    root square (None for a pass) to (visits, wins) and iterations run"""
+    if iterations is None and time_limit is None:
+        iterations = DEFAULT_ITERATIONS
+
+    rng = random.Random(seed)
+    rollout_policy = POLICIES[policy]
+    root = Node(player, opponent)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    done = 0
+
+    while (iterations is None or done < iterations) and (deadline is None or time.perf_counter() < deadline):
+        node = root
+        while not node.untried and node.children:
+            node = node.select_child(exploration)
+
+        if node.untried:
+            node = node.expand(rng)
+
+        # the result for the color that moved into node is the opposite of its color to move
+        value = 1.0 - rollout(node.player, node.opponent, rollout_policy, rng)
+        while node is not None:
+            node.visits += 1
+            node.wins += value
+            value = 1.0 - value
+            node = node.parent
+
+        done += 1
+
+    return {child.square: (child.visits, child.wins) for child in root.children}, done
+
+
+def run_mcts(player, opponent, iterations=None, time_limit=None, workers=1, seed=0,
+             exploration=1.4, policy="random"):
+    """takes the bitboards of the player to move and of the opponent, total iterations, time
+    limit in seconds, number of worker processes (all cores when None), seed, UCT exploration
+    constant and rollout policy name as parameters; with more than one worker each grows its
+    own tree for its share of the iterations and the root counts are added together; returns
+    MCTSResult with the most visited square (None if the player has to pass or the game is
+    over), dictionary of square to (visits, wins) and total iterations"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if iterations is None and time_limit is None:
+        iterations = DEFAULT_ITERATIONS
+
+    if workers == 1:
+        results = [search_tree(player, opponent, iterations, time_limit, seed, exploration, policy)]
+    else:
+        share = None if iterations is None else -(-iterations // workers)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(search_tree, player, opponent, share, time_limit,
+                                   seed * 1000003 + worker, exploration, policy)
+                       for worker in range(workers)]
+            results = [future.result() for future in futures]
+
+    stats = {}
+    total = 0
+    for tree_stats, done in results:
+        total += done
+        for square, (visits, wins) in tree_stats.items():
+            merged_visits, merged_wins = stats.get(square, (0, 0.0))
+            stats[square] = (merged_visits + visits, merged_wins + wins)
+
+    best = None
+    if stats:
+        best = max(stats, key=lambda square: (stats[square][0], stats[square][1]))
+
+    return MCTSResult(best, stats, total)
@@ -0,0 +1,238 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Optional hot-path instrumentation for the Othello game. enable() swaps timing
+# wrappers in for the Othello methods on the move path (play_game, make_move, find_captures and
+# compute_flips, place_piece, the incremental update_available_positions with the
+# is_available_position checks it makes, return_available_positions and check_end) and
+# disable() puts the original methods back, so when instrumentation is off the game runs its
+# own code with no checks at all. The older validate_* and capture_* recursions are not on that
+# path any more and are not instrumented. While on, a Metrics object counts calls, time and
+# nodes (the instrumented calls made underneath each call, including recursive ones, tracked
+# per thread and game so concurrent calls are each timed), keeps latency histograms for
+# make_move and play_game and remembers the slowest moves with their position hash. Results
+# can be exported as a dictionary or as a Prometheus text snapshot.
+
+import heapq
+import inspect
+import os
+import threading
+import time
+
+from Othello import BitboardOthello, Othello
+
+INSTRUMENTED = ("play_game", "make_move", "find_captures", "compute_flips", "place_piece",
+                "update_available_positions", "is_available_position",
+                "return_available_positions", "check_end")
+
+MOVE_FUNCTIONS = ("make_move", "play_game")  # per-move latency histograms are kept for these
+
+# upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                   0.01, 0.025, 0.1)
+
+
+class FunctionStats:
+    """Counts for one instrumented method: top level calls, seconds spent in them, nodes
+    visited underneath them and the most nodes one call visited"""
+
+    __slots__ = ("calls", "seconds", "nodes", "max_nodes")
+
+    def __init__(self):
+        """initializes every count to zero"""
+        self.calls = 0
+        self.seconds = 0.0
+        self.nodes = 0
+        self.max_nodes = 0
+
+
+class Metrics:
+    """Collects the counts, histograms and slowest moves recorded while instrumentation is on"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, slowest=20):
+        """takes histogram bucket upper bounds in seconds and number of slowest moves to keep
+        as parameters"""
+        self._buckets = tuple(sorted(buckets))
+        self._slowest_count = slowest
+        self._functions = {name: FunctionStats() for name in INSTRUMENTED}
+        self._histograms = {name: [0] * (len(self._buckets) + 1) for name in MOVE_FUNCTIONS}
+        self._slowest = []  # heap of (seconds, function, position hash, color, position)
+        self._lock = threading.Lock()  # guards the counts against calls from other threads
+        self._local = threading.local()
+
+    def thread_state(self):
+        """returns this thread's record of the instrumented calls it is running, as a set of
+        (method name, game id) whose inner calls are recursion and not timed again, and of its
+        count of instrumented calls, recursive or not; calls from other threads or games are
+        timed on their own"""
+        local = self._local
+        if not hasattr(local, "active"):
+            local.active = set()
+            local.nodes = 0
+        return local
+
+    def record_call(self, name, seconds, nodes):
+        """takes method name, seconds one top level call took and nodes it visited as
+        parameters; adds them to the method's counts; does not return anything"""
+        stats = self._functions[name]
+        with self._lock:
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.nodes += nodes
+            stats.max_nodes = max(stats.max_nodes, nodes)
+
+    def function_stats(self, name):
+        """takes method name as a parameter; returns its FunctionStats"""
+        return self._functions[name]
+
+    def record_move(self, name, seconds, game, color, position):
+        """takes method name, seconds the move took, the game, color and position as parameters;
+        adds the move to the latency histogram and the slowest moves; does not return anything"""
+        entry = (seconds, name, game.position_hash(), color, position)
+        histogram = self._histograms[name]
+
+        with self._lock:
+            for index, bound in enumerate(self._buckets):
+                if seconds <= bound:
+                    histogram[index] += 1
+                    break
+            else:
+                histogram[-1] += 1
+
+            if len(self._slowest) < self._slowest_count:
+                heapq.heappush(self._slowest, entry)
+            elif seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def as_dict(self):
+        """returns dictionary of the per-method counts, the cumulative latency histograms keyed
+        by bucket upper bound ("+Inf" for the last) and the slowest moves, slowest first"""
+        functions = {}
+        for name, stats in self._functions.items():
+            if stats.calls:
+                functions[name] = {"calls": stats.calls, "seconds": stats.seconds,
+                                   "nodes": stats.nodes, "max_nodes": stats.max_nodes,
+                                   "mean_nodes": stats.nodes / stats.calls}
+
+        histograms = {}
+        for name, counts in self._histograms.items():
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(self._buckets + ("+Inf",), counts):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+            histograms[name] = {"buckets": buckets, "count": cumulative,
+                                "sum": self._functions[name].seconds}
+
+        slowest = [{"seconds": seconds, "function": name, "position_hash": position_hash,
+                    "color": color, "position": position}
+                   for seconds, name, position_hash, color, position in sorted(self._slowest, reverse=True)]
+
+        return {"functions": functions, "move_latency": histograms, "slowest_moves": slowest}
+
+    def prometheus_text(self):
+        """returns the counts and histograms in the Prometheus text exposition format"""
+        snapshot = self.as_dict()
+        lines = []
+
+        for metric, key, kind in (("othello_calls_total", "calls", "counter"),
+                                  ("othello_call_seconds_total", "seconds", "counter"),
+                                  ("othello_call_nodes_total", "nodes", "counter"),
+                                  ("othello_call_nodes_max", "max_nodes", "gauge")):
+            lines.append("# TYPE %s %s" % (metric, kind))
+            for name, stats in snapshot["functions"].items():
+                lines.append('%s{function="%s"} %s' % (metric, name, stats[key]))
+
+        lines.append("# TYPE othello_move_latency_seconds histogram")
+        for name, histogram in snapshot["move_latency"].items():
+            for bound, count in histogram["buckets"].items():
+                lines.append('othello_move_latency_seconds_bucket{function="%s",le="%s"} %d' % (name, bound, count))
+            lines.append('othello_move_latency_seconds_sum{function="%s"} %s' % (name, histogram["sum"]))
+            lines.append('othello_move_latency_seconds_count{function="%s"} %d' % (name, histogram["count"]))
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """takes file path as a parameter; writes prometheus_text to a temporary file and moves
+        it over path, so a collector reading the file never sees half a snapshot; does not
+        return anything"""
+        temporary = path + ".tmp"
+        with open(temporary, "w") as output:
+            output.write(self.prometheus_text())
+        os.replace(temporary, path)
+
+
+_originals = []  # (class, method name, original function) while instrumentation is on
+
+
+def _move_arguments(signature, game, args, kwargs):
+    """takes the signature of a move method and the arguments of a call as parameters; returns
+    tuple of the color and position the call was made with, whether passed by position or by
+    keyword, (None, None) when the arguments do not fit the signature"""
+    try:
+        arguments = signature.bind(game, *args, **kwargs).arguments
+    except TypeError:
+        return None, None
+
+    color_name, position_name = list(signature.parameters)[1:3]
+    return arguments.get(color_name), arguments.get(position_name)
+
+
+def _wrap(metrics, name, function):
+    """returns a wrapper around function that records its calls in metrics"""
+    is_move = name in MOVE_FUNCTIONS
+    signature = inspect.signature(function)
+
+    def wrapper(self, *args, **kwargs):
+        state = metrics.thread_state()
+        state.nodes += 1
+        key = (name, id(self))
+        if key in state.active:  # recursive call, counted as a node of the running call
+            return function(self, *args, **kwargs)
+
+        state.active.add(key)
+        nodes_before = state.nodes
+        start = time.perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            state.active.discard(key)
+            metrics.record_call(name, elapsed, state.nodes - nodes_before + 1)
+            if is_move:
+                color, position = _move_arguments(signature, self, args, kwargs)
+                metrics.record_move(name, elapsed, self, color, position)
+
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def enable(metrics=None):
+    """takes an optional Metrics to record into as a parameter; instruments Othello and
+    BitboardOthello, replacing any earlier instrumentation; returns the Metrics in use"""
+    disable()
+    if metrics is None:
+        metrics = Metrics()
+
+    for cls in (Othello, BitboardOthello):
+        for name in INSTRUMENTED:
+            function = cls.__dict__.get(name)
+            if function is not None:
+                _originals.append((cls, name, function))
+                setattr(cls, name, _wrap(metrics, name, function))
+
+    return metrics
+
+
+def disable():
+    """puts the original methods back; does nothing if instrumentation is off"""
+    while _originals:
+        cls, name, function = _originals.pop()
+        setattr(cls, name, function)
+
+
+def is_enabled():
+    """returns true while instrumentation is on"""
+    return bool(_originals)
@@ -0,0 +1,201 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Diff-based rendering of Othello boards and asyncio fan-out of the diffs to
+# spectators. DiffRenderer remembers the two bitboards of the last frame and reports only the
+# cells that changed since, found with one XOR per color, so a move costs the placed disc plus
+# its flips (and an undo the same cells back) instead of the whole grid. It can print the
+# changes in place on a terminal that already shows print_board, or hand them to a
+# BroadcastHub, which encodes each frame once and pushes the same bytes to every subscriber.
+# A subscriber that could not take a frame is sent a keyframe of the whole board next time,
+# so it never applies a diff on top of a board it does not have.
+#
+# Frames are dictionaries: {"frame": n, "X": [...], "O": [...], ".": [...]}, each list
+# holding the bit indexes, (row - 1) * size + (col - 1), of the cells now showing that symbol.
+# Diffs are sent as {"event": "diff", ...}. A keyframe, {"event": "keyframe", ...}, adds "size"
+# and lists every disc; cells it leaves out are empty.
+
+import asyncio
+import json
+
+import bitboard
+
+SYMBOLS = ("X", "O", ".")
+
+
+class DiffRenderer:
+    """Produces the cells of a game's board that changed since the last frame"""
+
+    __slots__ = ("_game", "_black", "_white", "_frame")
+
+    def __init__(self, game):
+        """takes an Othello game as a parameter; the first frame holds every disc"""
+        self._game = game
+        self._black = 0
+        self._white = 0
+        self._frame = 0
+
+    def get_frame_number(self):
+        """returns number of the last frame produced, 0 before the first"""
+        return self._frame
+
+    def frame(self):
+        """returns frame dictionary of the cells that changed since the last frame, empty lists
+        when nothing did, and makes the current board the last frame"""
+        black, white = self._game.get_bitboards()
+        changed = (black ^ self._black) | (white ^ self._white)
+        self._black, self._white = black, white
+        self._frame += 1
+
+        return {"frame": self._frame,
+                "X": list(bitboard.squares(changed & black)),
+                "O": list(bitboard.squares(changed & white)),
+                ".": list(bitboard.squares(changed & ~(black | white)))}
+
+    def keyframe(self):
+        """returns frame dictionary of the whole board as of the last frame, for a spectator
+        that joins late or has missed frames"""
+        return {"frame": self._frame, "size": self._game.get_size(),
+                "X": list(bitboard.squares(self._black)),
+                "O": list(bitboard.squares(self._white)),
+                ".": []}
+
+    def ansi(self, frame, top=1):
+        """takes a frame dictionary and the terminal line print_board started on as parameters;
+        returns the ANSI escape text that redraws only the frame's cells over that printout and
+        leaves the cursor below the board"""
+        size = self._game.get_size()
+        parts = []
+
+        for symbol in SYMBOLS:
+            for square in frame[symbol]:
+                row, col = divmod(square, size)
+                # print_board puts row r on line top + r and column c at character 3 * c + 1
+                parts.append("\x1b[%d;%dH%s" % (top + row + 1, 3 * (col + 1) + 1, symbol))
+
+        parts.append("\x1b[%d;1H" % (top + size + 2))
+        return "".join(parts)
+
+    def print_changes(self, top=1):
+        """takes the terminal line print_board started on as a parameter; prints the cells that
+        changed since the last frame in place; does not return anything"""
+        print(self.ansi(self.frame(), top), end="", flush=True)
+
+
+class Spectator:
+    """In-process BroadcastHub subscriber: frames wait in a bounded queue until read with
+    receive or async iteration"""
+
+    def __init__(self, queue_size=64):
+        """takes maximum number of frames waiting to be read as a parameter"""
+        self._queue = asyncio.Queue(queue_size)
+        self._closed = False
+
+    def send_line(self, line):
+        """takes an encoded frame as a parameter; queues it; returns false, dropping it, when the
+        queue is full"""
+        try:
+            self._queue.put_nowait(line)
+        except asyncio.QueueFull:
+            return False
+
+        return True
+
+    async def receive(self):
+        """waits for the next frame; returns it decoded"""
+        return json.loads(await self._queue.get())
+
+    def close(self):
+        """stops the hub sending to this spectator"""
+        self._closed = True
+
+    def is_closed(self):
+        """returns true once close has been called"""
+        return self._closed
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.receive()
+
+
+class BroadcastHub:
+    """Fans the frames of one game out to its subscribers. A subscriber is any object with
+    send_line(bytes), returning false when the line could not be taken, and is_closed(), such
+    as a Spectator or a server connection"""
+
+    def __init__(self, game, fields=None):
+        """takes an Othello game and optional dictionary of fields, such as a game id, added to
+        every frame as parameters"""
+        self._renderer = DiffRenderer(game)
+        self._fields = dict(fields or {})
+        self._subscribers = set()
+        self._stale = set()  # subscribers that missed a frame and need a keyframe
+        self._renderer.frame()  # later frames are diffs against the current board
+
+    def __len__(self):
+        return len(self._subscribers)
+
+    def get_frame_number(self):
+        """returns number of the last frame published"""
+        return self._renderer.get_frame_number()
+
+    def encode(self, message):
+        """takes a dictionary as a parameter; returns it as one JSON line with the hub's fields
+        added"""
+        return (json.dumps(dict(message, **self._fields), separators=(",", ":")) + "\n").encode()
+
+    def encode_keyframe(self, fields):
+        """takes dictionary of extra fields as a parameter; returns the keyframe of the board as
+        one JSON line"""
+        return self.encode(dict(self._renderer.keyframe(), event="keyframe", **fields))
+
+    def subscribe(self, subscriber, keyframe=True):
+        """takes a subscriber and whether to send it a keyframe of the board as parameters; adds
+        it to the game; does not return anything"""
+        self._subscribers.add(subscriber)
+        if keyframe and not subscriber.send_line(self.encode_keyframe({})):
+            self._stale.add(subscriber)
+
+    def unsubscribe(self, subscriber):
+        """takes a subscriber as a parameter; stops sending it frames"""
+        self._subscribers.discard(subscriber)
+        self._stale.discard(subscriber)
+
+    def publish(self, **fields):
+        """takes extra fields for this frame, such as the color to move, as keyword parameters;
+        sends the cells changed since the last frame to every subscriber, encoded once, and a
+        keyframe instead to subscribers that missed a frame; drops closed subscribers; returns
+        number of subscribers the frame reached"""
+        line = self.encode(dict(self._renderer.frame(), event="diff", **fields))
+        keyframe_line = None
+        reached = 0
+
+        for subscriber in list(self._subscribers):
+            if subscriber.is_closed():
+                self.unsubscribe(subscriber)
+                continue
+
+            if subscriber in self._stale:
+                if keyframe_line is None:
+                    keyframe_line = self.encode_keyframe(fields)
+                if subscriber.send_line(keyframe_line):
+                    self._stale.discard(subscriber)
+                    reached += 1
+            elif subscriber.send_line(line):
+                reached += 1
+            else:
+                self._stale.add(subscriber)
+
+        return reached
+
+    def broadcast(self, message):
+        """takes a dictionary as a parameter; sends it, encoded once, to every subscriber that is
+        not closed; does not return anything"""
+        line = self.encode(message)
+        for subscriber in list(self._subscribers):
+            if subscriber.is_closed():
+                self.unsubscribe(subscriber)
+            else:
+                subscriber.send_line(line)
@@ -0,0 +1,269 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Alpha-beta search for the Othello game. Searcher runs negamax with alpha-beta
+# pruning and iterative deepening on the black and white bitboards, orders moves by the
+# transposition table's best move and then by square value, and stores results in a bounded
+# transposition table. Passing and the end of the game follow the same rules as
+# Othello.check_end: a color with no valid move passes, and the game ends when neither color
+# can move. Used by Othello.best_move.
+
+import collections
+import time
+
+import bitboard
+
+WIN_SCORE = 10000  # added to the final disc differential of a won game, so wins beat any estimate
+
+CORNERS = bitboard.CORNERS
+X_SQUARES = 0x0042000000004200  # diagonal neighbours of the corners
+C_SQUARES = 0x4281000000008142  # edge neighbours of the corners
+EDGES = 0xFF818181818181FF & ~(CORNERS | C_SQUARES)
+# (corner, its X and C squares) for each corner
+CORNER_NEIGHBOURS = (
+    (1 << 0, (1 << 1) | (1 << 8) | (1 << 9)),
+    (1 << 7, (1 << 6) | (1 << 15) | (1 << 14)),
+    (1 << 56, (1 << 57) | (1 << 48) | (1 << 49)),
+    (1 << 63, (1 << 62) | (1 << 55) | (1 << 54)),
+)
+MIDDLE = bitboard.FULL & ~(CORNERS | X_SQUARES | C_SQUARES | EDGES)
+
+# squares in the order moves are tried: corners, edges, middle, then squares next to corners
+MOVE_ORDER = tuple(
+    square
+    for group in (CORNERS, EDGES, MIDDLE, C_SQUARES, X_SQUARES)
+    for square in range(64) if group >> square & 1)
+
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+SearchResult = collections.namedtuple(
+    "SearchResult", ["move", "score", "depth", "nodes", "nodes_per_second"])
+
+
+class SearchTimeout(Exception):
+    """raised inside the search when the time limit runs out; the deepest finished iteration
+    is used instead"""
+
+
+def final_score(player, opponent):
+    """takes the bitboards of the player to move and of the opponent at the end of a game as
+    parameters; returns the score of the game for the player to move"""
+    difference = bitboard.popcount(player) - bitboard.popcount(opponent)
+
+    if difference > 0:
+        return WIN_SCORE + difference
+
+    if difference < 0:
+        return -WIN_SCORE + difference
+
+    return 0
+
+
+def evaluate(player, opponent):
+    """takes the bitboards of the player to move and of the opponent as parameters; returns a
+    static estimate of the position for the player to move from corners, squares next to empty
+    corners, edges and mobility"""
+    empty = ~(player | opponent)
+    # squares next to an empty corner give the opponent a way into it
+    risky = 0
+    for corner, neighbours in CORNER_NEIGHBOURS:
+        if empty & corner:
+            risky |= neighbours
+
+    score = 30 * (bitboard.popcount(player & CORNERS) - bitboard.popcount(opponent & CORNERS))
+    score -= 12 * (bitboard.popcount(player & risky) - bitboard.popcount(opponent & risky))
+    score += 3 * (bitboard.popcount(player & EDGES) - bitboard.popcount(opponent & EDGES))
+    score += 5 * (bitboard.popcount(bitboard.legal_moves(player, opponent))
+                  - bitboard.popcount(bitboard.legal_moves(opponent, player)))
+
+    return score
+
+
+class TranspositionTable:
+    """Fixed size table of search results indexed by position. Each slot holds one entry; a new
+    entry replaces the stored one when the slot is empty, holds the same position, was written
+    by an earlier search, or was searched to the same depth or less"""
+
+    def __init__(self, size=1 << 16):
+        """takes number of slots as a parameter, rounded down to a power of two"""
+        size = 1 << (size.bit_length() - 1)
+        self._mask = size - 1
+        self._slots = [None] * size
+        self._generation = 0
+
+    def new_search(self):
+        """marks entries stored so far as old so the next search may replace them"""
+        self._generation += 1
+
+    def lookup(self, player, opponent):
+        """takes the bitboards of the player to move and of the opponent as parameters; returns
+        the stored (depth, flag, score, best square) for the position, None if it is not stored"""
+        entry = self._slots[hash((player, opponent)) & self._mask]
+
+        if entry is not None and entry[0] == player and entry[1] == opponent:
+            return entry[3], entry[4], entry[5], entry[6]
+
+        return None
+
+    def store(self, player, opponent, depth, flag, score, square):
+        """takes the bitboards of the player to move and of the opponent, search depth, bound
+        flag, score and best square as parameters; stores them following the replacement
+        policy; does not return anything"""
+        index = hash((player, opponent)) & self._mask
+        entry = self._slots[index]
+
+        if (entry is None or entry[2] != self._generation or depth >= entry[3]
+                or (entry[0] == player and entry[1] == opponent)):
+            self._slots[index] = (player, opponent, self._generation, depth, flag, score, square)
+
+
+class Searcher:
+    """Negamax alpha-beta searcher over bitboards with iterative deepening, move ordering and a
+    transposition table that is kept between searches"""
+
+    def __init__(self, table_size=1 << 16, evaluator=None):
+        """takes number of transposition table slots and the static evaluation function, called
+        with the bitboards of the player to move and of the opponent (evaluate when None), as
+        parameters"""
+        self._table = TranspositionTable(table_size)
+        self._evaluate = evaluate if evaluator is None else evaluator
+        self._nodes = 0
+        self._deadline = None
+
+    def search(self, player, opponent, depth=None, time_limit=None):
+        """takes the bitboards of the player to move and of the opponent, maximum depth and time
+        limit in seconds as parameters; deepens one ply at a time until the depth is reached or
+        the time runs out; returns SearchResult with the best square, its score, the deepest
+        finished depth, nodes searched and nodes per second"""
+        empties = 64 - bitboard.popcount(player | opponent)
+        if depth is None:
+            depth = empties if time_limit is not None else 6
+
+        start = time.perf_counter()
+        self._deadline = None if time_limit is None else start + time_limit
+        self._nodes = 0
+        self._table.new_search()
+
+        best_square = None
+        best_score = 0
+        finished = 0
+
+        for current in range(1, max(depth, 1) + 1):
+            try:
+                best_score, best_square = self._root(player, opponent, current, best_square)
+            except SearchTimeout:
+                break
+
+            finished = current
+            if current >= empties:  # searched to the end of the game
+                break
+
+        if best_square is None:
+            # out of time before the first iteration finished; fall back to move ordering
+            moves = bitboard.legal_moves(player, opponent)
+            if moves:
+                best_square = self._ordered(moves, None)[0]
+
+        elapsed = time.perf_counter() - start
+        nodes_per_second = self._nodes / elapsed if elapsed > 0 else 0.0
+
+        return SearchResult(best_square, best_score, finished, self._nodes, nodes_per_second)
+
+    def _root(self, player, opponent, depth, previous_best):
+        """searches every root move to the given depth, trying the previous iteration's best
+        move first; returns best score and best square"""
+        moves = bitboard.legal_moves(player, opponent)
+
+        if not moves:
+            # the root color passes, or the game is over
+            return self._negamax(player, opponent, depth, -WIN_SCORE * 2, WIN_SCORE * 2, False), None
+
+        alpha = -WIN_SCORE * 2
+        best_square = None
+
+        for square in self._ordered(moves, previous_best):
+            flipped = bitboard.flips(player, opponent, square)
+            placed = 1 << square
+            score = -self._negamax(opponent & ~flipped, player | placed | flipped, depth - 1,
+                                   -WIN_SCORE * 2, -alpha, False)
+
+            if best_square is None or score > alpha:
+                alpha = score
+                best_square = square
+
+        self._table.store(player, opponent, depth, EXACT, alpha, best_square)
+        return alpha, best_square
+
+    def _negamax(self, player, opponent, depth, alpha, beta, passed):
+        """returns the score of the position for the player to move, searched to the given
+        depth inside the alpha-beta window; passed is true when the opponent has just passed"""
+        self._nodes += 1
+        if self._deadline is not None and not self._nodes & 1023 and time.perf_counter() > self._deadline:
+            raise SearchTimeout
+
+        moves = bitboard.legal_moves(player, opponent)
+
+        if not moves:
+            if passed:  # neither color can move
+                return final_score(player, opponent)
+            return -self._negamax(opponent, player, depth, -beta, -alpha, True)
+
+        if depth == 0:
+            return self._evaluate(player, opponent)
+
+        original_alpha = alpha
+        table_square = None
+        entry = self._table.lookup(player, opponent)
+
+        if entry is not None:
+            stored_depth, flag, score, table_square = entry
+            if stored_depth >= depth:
+                if flag == EXACT:
+                    return score
+                if flag == LOWER and score > alpha:
+                    alpha = score
+                elif flag == UPPER and score < beta:
+                    beta = score
+                if alpha >= beta:
+                    return score
+
+        best_score = -WIN_SCORE * 2
+        best_square = None
+
+        for square in self._ordered(moves, table_square):
+            flipped = bitboard.flips(player, opponent, square)
+            placed = 1 << square
+            score = -self._negamax(opponent & ~flipped, player | placed | flipped, depth - 1,
+                                   -beta, -alpha, False)
+
+            if score > best_score:
+                best_score = score
+                best_square = square
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score <= original_alpha:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+
+        self._table.store(player, opponent, depth, flag, best_score, best_square)
+        return best_score
+
+    @staticmethod
+    def _ordered(moves, first):
+        """takes bitboard of legal moves and square to try first (or None) as parameters;
+        returns list of the legal squares in search order"""
+        ordered = [square for square in MOVE_ORDER if moves >> square & 1]
+
+        if first is not None and moves >> first & 1:
+            ordered.remove(first)
+            ordered.insert(0, first)
+
+        return ordered
@@ -0,0 +1,140 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Self-play simulator for the Othello game. Plays complete games with uniformly
+# random moves through the Othello rules, spreads them across a pool of worker processes,
+# and streams each finished game's result and move list back as soon as its batch is done.
+# Every batch of games gets its own seed, so a run is reproducible no matter how many
+# workers play it or in which order their batches finish.
+
+import argparse
+import collections
+import concurrent.futures
+import json
+import os
+import random
+import time
+
+from Othello import Othello
+
+GameResult = collections.namedtuple(
+    "GameResult", ["game_id", "winner", "black_pieces", "white_pieces", "moves"])
+
+
+def batch_seed(seed, batch_index):
+    """takes run seed and batch number as parameters; returns the seed for that batch's random
+    number generator"""
+    return seed * 1000003 + batch_index
+
+
+def play_random_game(rng, engine="bitboard"):
+    """takes a random.Random and optional engine name as parameters; plays one game from the
+    starting position, each color choosing uniformly among its available positions and passing
+    when it has none; returns winning color, black and white piece counts and list of moves"""
+    game = Othello(engine)
+    color, opponent = "black", "white"
+    moves = []
+
+    while True:
+        position = rng.choice(game.return_available_positions(color))
+        game.place_piece(color, position, game.find_captures(color, position))
+        moves.append(position)
+
+        game.check_end(color, opponent)
+        if game.get_winning_color() is not None:
+            black_pieces, white_pieces = game.get_piece_counts()
+            return game.get_winning_color(), black_pieces, white_pieces, moves
+
+        if game.has_available_positions(opponent):  # otherwise color moves again
+            color, opponent = opponent, color
+
+
+def play_batch(batch_index, first_game, games, seed, engine="bitboard"):
+    """worker function; takes batch number, id of its first game, number of games, run seed and
+    engine name as parameters; returns list of GameResult for the batch"""
+    rng = random.Random(batch_seed(seed, batch_index))
+    results = []
+
+    for game_id in range(first_game, first_game + games):
+        winner, black_pieces, white_pieces, moves = play_random_game(rng, engine)
+        results.append(GameResult(game_id, winner, black_pieces, white_pieces, moves))
+
+    return results
+
+
+def run_batches(function, batches, workers=None):
+    """takes a worker function returning a list of results, list of argument tuples, one per
+    batch, and number of worker processes (all cores by default) as parameters; generator that
+    yields every result of each batch as batches complete, keeping a few batches queued per
+    worker instead of submitting them all at once; with one worker the batches are run in
+    order in this process"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        for batch in batches:
+            yield from function(*batch)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        remaining = iter(batches)
+
+        for batch in remaining:
+            pending.add(pool.submit(function, *batch))
+            if len(pending) >= workers * 4:
+                break
+
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            for future in done:
+                next_batch = next(remaining, None)
+                if next_batch is not None:
+                    pending.add(pool.submit(function, *next_batch))
+
+                yield from future.result()
+
+
+def run_selfplay(games, workers=None, seed=0, batch_size=500, engine="bitboard"):
+    """takes number of games, number of worker processes (all cores by default), run seed,
+    games per batch and engine name as parameters; generator that yields a GameResult for each
+    finished game as batches complete; with one worker the games are played in this process"""
+    batches = []
+    for batch_index, first_game in enumerate(range(0, games, batch_size)):
+        batches.append((batch_index, first_game, min(batch_size, games - first_game), seed, engine))
+
+    yield from run_batches(play_batch, batches, workers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play random Othello games across processes.")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--engine", choices=("list", "bitboard"), default="bitboard")
+    parser.add_argument("--output", help="write one JSON line per finished game to this file")
+    args = parser.parse_args()
+
+    wins = {"black": 0, "white": 0, "tie": 0}
+    output = open(args.output, "w") if args.output else None
+    start = time.perf_counter()
+
+    try:
+        for result in run_selfplay(args.games, args.workers, args.seed, args.batch_size, args.engine):
+            wins[result.winner] += 1
+            if output is not None:
+                output.write(json.dumps(result._asdict()) + "\n")
+    finally:
+        if output is not None:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    print("games:", args.games, "black:", wins["black"], "white:", wins["white"], "tie:", wins["tie"])
+    print("games/sec: %.1f" % (args.games / elapsed))
+
+
+if __name__ == '__main__':
+    main()
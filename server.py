@@ -0,0 +1,341 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Asyncio TCP server that hosts many Othello games at once in a single thread.
+# Clients send one JSON object per line and receive one JSON object per line:
+#   {"op": "create"}                                  -> {"ok": true, "game": id}
+#   {"op": "join", "game": id, "name": n, "color": c}  -> create_player, then board updates
+#   {"op": "watch", "game": id}                        -> board updates without playing
+#   {"op": "move", "game": id, "position": [row, col]} -> play_game for the joined color
+#   {"op": "board", "game": id}                        -> the current board
+#   {"op": "leave", "game": id}                        -> stop receiving board updates
+# Joining, watching and asking for the board answer with the full {"event": "board", ...},
+# including the number of the last frame. Every accepted move then sends only the cells that
+# changed, {"event": "diff", "frame": n, "X": [...], "O": [...], ...} as described in render.py,
+# to the players and watchers of that game, encoded once for all of them.
+# Each connection has a bounded outgoing queue drained by its own writer task, so a slow
+# client cannot make the server buffer without limit: when its queue is full it is
+# disconnected. Connections that are in no game and stay silent for too long are closed, and
+# games nobody has touched for too long are removed.
+
+import argparse
+import asyncio
+import itertools
+import json
+import time
+
+from Othello import Othello
+from render import BroadcastHub
+
+COLORS = ("black", "white")
+
+
+class Connection:
+    """One client connection. Replies and board updates go through a bounded queue that a
+    writer task sends in order, waiting for the socket to drain after each line"""
+
+    def __init__(self, writer, queue_size):
+        """takes the asyncio stream writer and maximum number of queued lines as parameters"""
+        self._writer = writer
+        self._queue = asyncio.Queue(queue_size)
+        self._task = asyncio.ensure_future(self._send_lines())
+        self.games = {}  # game id -> joined color, None when watching
+
+    def send(self, message):
+        """takes a JSON-serializable dictionary as a parameter; queues it to be sent; returns
+        false and closes the connection when the client is too far behind, true otherwise"""
+        return self.send_line((json.dumps(message) + "\n").encode())
+
+    def send_line(self, line):
+        """takes an encoded line as a parameter; queues it to be sent as is, so a line encoded
+        once can go to many connections; returns false and closes the connection when the
+        client is too far behind, true otherwise"""
+        try:
+            self._queue.put_nowait(line)
+        except asyncio.QueueFull:
+            self.close()
+            return False
+
+        return True
+
+    async def _send_lines(self):
+        """writer task; sends queued lines until the connection closes"""
+        try:
+            while True:
+                line = await self._queue.get()
+                self._writer.write(line)
+                await self._writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._writer.close()
+
+    def close(self):
+        """stops the writer task, which closes the socket"""
+        self._task.cancel()
+
+    def is_closed(self):
+        """returns true once the connection has been closed"""
+        return self._task.done()
+
+
+class GameSession:
+    """An Othello game hosted by the server with its players, watchers and color to move"""
+
+    def __init__(self, game_id, engine):
+        """takes game id and engine name as parameters"""
+        self.game_id = game_id
+        self.game = Othello(engine, quiet=True)
+        self.players = {}  # color -> Connection
+        # every Connection receiving board updates
+        self.watchers = BroadcastHub(self.game, {"game": game_id})
+        self.to_move = "black"
+        self.last_active = time.monotonic()
+
+    def board_event(self):
+        """returns dictionary describing the board, piece counts, color to move and winner"""
+        black_pieces, white_pieces = self.game.get_piece_counts()
+        return {
+            "event": "board",
+            "game": self.game_id,
+            "board": ["".join(row) for row in self.game.get_board()],
+            "black": black_pieces,
+            "white": white_pieces,
+            "to_move": None if self.game.get_winning_color() else self.to_move,
+            "winner": self.game.get_winning_color(),
+            "frame": self.watchers.get_frame_number(),
+        }
+
+    def broadcast_move(self):
+        """sends the cells the last move changed, piece counts, color to move and winner to
+        every player and watcher, dropping connections that have fallen too far behind; does
+        not return anything"""
+        black_pieces, white_pieces = self.game.get_piece_counts()
+        self.watchers.publish(black=black_pieces, white=white_pieces,
+                              to_move=None if self.game.get_winning_color() else self.to_move,
+                              winner=self.game.get_winning_color())
+
+
+class OthelloServer:
+    """Hosts Othello sessions for line-oriented JSON clients over TCP"""
+
+    def __init__(self, host="127.0.0.1", port=7474, engine="bitboard", queue_size=64,
+                 idle_timeout=300.0, session_timeout=1800.0):
+        """takes host, port, engine name, outgoing lines queued per connection, seconds a
+        connection may stay silent and seconds a game may go untouched as parameters"""
+        self._host = host
+        self._port = port
+        self._engine = engine
+        self._queue_size = queue_size
+        self._idle_timeout = idle_timeout
+        self._session_timeout = session_timeout
+        self._sessions = {}  # game id -> GameSession
+        self._connections = set()  # every open Connection
+        self._handlers = set()  # the task answering each open connection
+        self._game_ids = itertools.count(1)
+        self._server = None
+        self._reaper = None
+
+    async def start(self):
+        """starts listening and the task that removes expired games; returns the port, useful
+        when the server was created with port 0"""
+        self._server = await asyncio.start_server(self._handle_client, self._host, self._port)
+        self._reaper = asyncio.ensure_future(self._remove_expired_sessions())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """stops listening, closes every client connection, waits for their handlers to finish
+        and removes every game"""
+        self._reaper.cancel()
+        self._server.close()
+
+        for connection in list(self._connections):
+            connection.close()
+        if self._handlers:
+            await asyncio.wait(list(self._handlers))
+
+        await self._server.wait_closed()
+        self._sessions.clear()
+
+    def get_session_count(self):
+        """returns number of games being hosted"""
+        return len(self._sessions)
+
+    async def _remove_expired_sessions(self):
+        """reaper task; every few seconds removes games untouched for session_timeout"""
+        while True:
+            await asyncio.sleep(min(5.0, self._session_timeout))
+            now = time.monotonic()
+            for game_id, session in list(self._sessions.items()):
+                if now - session.last_active > self._session_timeout:
+                    session.watchers.broadcast({"event": "expired"})
+                    del self._sessions[game_id]
+
+    async def _handle_client(self, reader, writer):
+        """reads one request per line from a client and answers it until the client closes the
+        connection, falls too far behind or, while it is in no game being hosted, stays silent
+        past idle_timeout"""
+        connection = Connection(writer, self._queue_size)
+        handler = asyncio.current_task()
+        self._connections.add(connection)
+        self._handlers.add(handler)
+
+        try:
+            while not connection.is_closed():
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self._idle_timeout)
+                except asyncio.TimeoutError:
+                    # players waiting for their opponent and watchers may stay silent as long
+                    # as their games last; the reaper ends games nobody plays
+                    if any(game_id in self._sessions for game_id in connection.games):
+                        continue
+                    break
+                except (ValueError, ConnectionError):
+                    break  # line longer than the stream limit, or reset
+
+                if not line:
+                    break
+
+                try:
+                    request = json.loads(line)
+                    reply = self._dispatch(connection, request)
+                except (ValueError, KeyError, TypeError, AttributeError, IndexError) as error:
+                    reply = {"ok": False, "error": str(error)}
+
+                if reply is not None:
+                    connection.send(reply)
+        finally:
+            for game_id in connection.games:
+                session = self._sessions.get(game_id)
+                if session is not None:
+                    session.watchers.unsubscribe(connection)
+            connection.close()
+            self._connections.discard(connection)
+            self._handlers.discard(handler)
+
+    def _session(self, request):
+        """takes a request as a parameter; returns its GameSession; raises KeyError if the game
+        does not exist"""
+        session = self._sessions.get(request["game"])
+        if session is None:
+            raise KeyError("no game %s" % request["game"])
+
+        session.last_active = time.monotonic()
+        return session
+
+    def _dispatch(self, connection, request):
+        """takes the connection and a decoded request as parameters; carries out the request;
+        returns the reply for the requesting client, None if it has already been sent"""
+        op = request.get("op")
+
+        if op == "create":
+            game_id = next(self._game_ids)
+            self._sessions[game_id] = GameSession(game_id, self._engine)
+            return {"ok": True, "game": game_id}
+
+        session = self._session(request)
+
+        if op == "join":
+            color = request["color"]
+            if color not in COLORS:
+                raise ValueError("color must be 'black' or 'white'")
+            if connection.games.get(session.game_id) in COLORS:
+                raise ValueError("already joined game %s as %s"
+                                 % (session.game_id, connection.games[session.game_id]))
+
+            name = str(request["name"])
+            holder = session.players.get(color)
+            if holder is not None and not holder.is_closed():
+                raise ValueError("%s has already joined game %s" % (color, session.game_id))
+
+            # a color left or dropped stays with its player, who may take it back
+            player_name = session.game.get_player_name(color)
+            if player_name is None:
+                session.game.create_player(name, color)
+            elif player_name != name:
+                raise ValueError("%s is played by %s in game %s"
+                                 % (color, player_name, session.game_id))
+
+            session.players[color] = connection
+            session.watchers.subscribe(connection, keyframe=False)
+            connection.games[session.game_id] = color
+            connection.send({"ok": True, "game": session.game_id, "color": color})
+            return session.board_event()
+
+        if op == "watch":
+            session.watchers.subscribe(connection, keyframe=False)
+            connection.games.setdefault(session.game_id, None)
+            connection.send({"ok": True, "game": session.game_id})
+            return session.board_event()
+
+        if op == "board":
+            return session.board_event()
+
+        if op == "leave":
+            session.watchers.unsubscribe(connection)
+            color = connection.games.pop(session.game_id, None)
+            if color is not None and session.players.get(color) is connection:
+                del session.players[color]
+            return {"ok": True, "game": session.game_id}
+
+        if op == "move":
+            position = request["position"]
+            if (not isinstance(position, list) or len(position) != 2
+                    or not all(type(value) is int for value in position)):
+                raise ValueError("position must be a list of two integers [row, col]")
+            return self._move(connection, session, tuple(position))
+
+        raise ValueError("unknown op %r" % op)
+
+    def _move(self, connection, session, position):
+        """takes the connection, the game and the requested position as parameters; plays the
+        move for the connection's color through play_game when it is that color's turn, hands
+        the turn to the color play_game reports, then replies and sends the new board to the game;
+        returns None once the move is played, the reply otherwise"""
+        color = connection.games.get(session.game_id)
+        if color is None:
+            raise ValueError("join game %s as a color before moving" % session.game_id)
+        if session.game.get_winning_color() is not None:
+            raise ValueError("game %s has ended" % session.game_id)
+        if color != session.to_move:
+            raise ValueError("it is %s's turn" % session.to_move)
+
+        result = session.game.play_game(color, position)
+        if not result.accepted:
+            return {"ok": False, "error": "Invalid move", "valid_moves": result.available_positions}
+
+        if result.next_color is not None:
+            session.to_move = result.next_color
+
+        connection.send({"ok": True, "game": session.game_id, "flipped": result.flipped})
+        session.broadcast_move()
+        return None
+
+
+async def serve(host, port, engine):
+    """runs an OthelloServer until cancelled"""
+    server = OthelloServer(host, port, engine)
+    port = await server.start()
+    print("serving Othello on %s:%d" % (host, port))
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host Othello games over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7474)
+    parser.add_argument("--engine", choices=("list", "bitboard"), default="bitboard")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.engine))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
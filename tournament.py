@@ -0,0 +1,265 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Round-robin tournament runner for Othello player strategies. Every pair of
+# players meets for the same number of games, half with each color. Games are played through
+# create_player and play_game, scored from return_winner, spread across a pool of worker
+# processes in seeded batches and streamed back as batches finish. Elo ratings are fitted to
+# all results by maximum likelihood (Bradley-Terry, a tie counting half a win) and reported
+# with confidence intervals.
+#
+# A strategy is a function taking the game, the color to move and a random.Random and
+# returning one of game.return_available_positions(color). It must be defined at the top level
+# of an importable module so worker processes can load it.
+
+import argparse
+import collections
+import itertools
+import math
+import random
+import time
+
+import selfplay
+from Othello import Othello
+
+GameRecord = collections.namedtuple(
+    "GameRecord", ["game_id", "black", "white", "winner", "black_pieces", "white_pieces",
+                   "outcome"])
+Rating = collections.namedtuple("Rating", ["name", "elo", "low", "high", "games", "score"])
+
+ELO_SCALE = 400 / math.log(10)  # Elo points per unit of natural log strength
+Z_95 = 1.959964
+
+CORNER_POSITIONS = frozenset(((1, 1), (1, 8), (8, 1), (8, 8)))
+X_POSITIONS = frozenset(((2, 2), (2, 7), (7, 2), (7, 7)))  # diagonally next to the corners
+
+
+def random_strategy(game, color, rng):
+    """strategy; plays a uniformly chosen available position"""
+    return rng.choice(game.return_available_positions(color))
+
+
+def greedy_strategy(game, color, rng):
+    """strategy; plays the available position that flips the most pieces, ties broken at
+    random"""
+    flips = {position: len(game.compute_flips(color, position))
+             for position in game.return_available_positions(color)}
+    most = max(flips.values())
+    return rng.choice([position for position, count in flips.items() if count == most])
+
+
+def corners_strategy(game, color, rng):
+    """strategy; takes a corner when one is available, avoids the squares diagonally next to
+    the corners when anything else is, and otherwise plays at random"""
+    available = game.return_available_positions(color)
+    corners = [position for position in available if position in CORNER_POSITIONS]
+    if corners:
+        return rng.choice(corners)
+
+    safe = [position for position in available if position not in X_POSITIONS]
+    return rng.choice(safe or available)
+
+
+def search_strategy(game, color, rng):
+    """strategy; plays Othello.best_move searched 3 plies deep"""
+    return game.best_move(color, depth=3).move
+
+
+def mcts_strategy(game, color, rng):
+    """strategy; plays Othello.mcts_move with 200 iterations in this process"""
+    return game.mcts_move(color, iterations=200, seed=rng.getrandbits(32)).move
+
+
+STRATEGIES = {
+    "random": random_strategy,
+    "greedy": greedy_strategy,
+    "corners": corners_strategy,
+    "search": search_strategy,
+    "mcts": mcts_strategy,
+}
+
+
+def register_strategy(name, strategy):
+    """takes player name and strategy function as parameters; makes the strategy available by
+    name to run_tournament and the command line; does not return anything"""
+    STRATEGIES[name] = strategy
+
+
+def play_match(black, white, strategies, rng, engine="bitboard"):
+    """takes the names of the black and white players, dictionary of name to strategy, a
+    random.Random and engine name as parameters; plays one game; returns tuple of winning
+    player's name (None for a tie), black and white piece counts and return_winner's text"""
+    game = Othello(engine, quiet=True)
+    game.create_player(black, "black")
+    game.create_player(white, "white")
+    color = "black"
+
+    while True:
+        name = game.get_player_name(color)
+        result = game.play_game(color, strategies[name](game, color, rng))
+        if not result.accepted:
+            raise ValueError("%s played an invalid move %s" % (name, result.position))
+
+        if result.game_over:
+            outcome = game.return_winner()
+            winner = None if result.winner == "tie" else game.get_player_name(result.winner)
+            return winner, result.black_pieces, result.white_pieces, outcome
+
+        color = result.next_color
+
+
+def play_batch(batch_index, games, strategies, seed, engine="bitboard"):
+    """worker function; takes batch number, list of (game id, black name, white name), dictionary
+    of name to strategy, run seed and engine name as parameters; returns list of GameRecord for
+    the batch"""
+    rng = random.Random(selfplay.batch_seed(seed, batch_index))
+    records = []
+
+    for game_id, black, white in games:
+        outcome = play_match(black, white, strategies, rng, engine)
+        records.append(GameRecord(game_id, black, white, *outcome))
+
+    return records
+
+
+def schedule(names, games_per_pairing):
+    """takes list of player names and an even number of games per pairing as parameters;
+    returns list of (game id, black name, white name) where every pair plays games_per_pairing
+    games, alternating colors so each player has black in half of them, interleaved so that
+    any prefix of the schedule is spread over all pairings"""
+    pairings = list(itertools.combinations(names, 2))
+    games = []
+
+    for round_number in range(games_per_pairing):
+        for first, second in pairings:
+            if round_number % 2:
+                first, second = second, first
+            games.append((len(games), first, second))
+
+    return games
+
+
+def run_tournament(names, games_per_pairing, workers=None, seed=0, batch_size=50,
+                   engine="bitboard"):
+    """takes list of player names registered in STRATEGIES, games per pairing, number of worker
+    processes (all cores by default), run seed, games per batch and engine name as parameters;
+    generator that yields a GameRecord for each finished game as batches complete; with one
+    worker the games are played in this process"""
+    if len(set(names)) < 2:
+        raise ValueError("a tournament needs at least two different players")
+    if len(set(names)) != len(names):
+        raise ValueError("every player may only be entered once")
+    if games_per_pairing < 2 or games_per_pairing % 2:
+        raise ValueError("games per pairing must be a positive even number, so every pairing "
+                         "plays as many games with each color")
+
+    strategies = {name: STRATEGIES[name] for name in names}
+    games = schedule(names, games_per_pairing)
+    batches = [(batch_index, games[first:first + batch_size], strategies, seed, engine)
+               for batch_index, first in enumerate(range(0, len(games), batch_size))]
+
+    yield from selfplay.run_batches(play_batch, batches, workers)
+
+
+def compute_ratings(records, anchor=1500.0, confidence=Z_95, iterations=1000):
+    """takes iterable of GameRecord, the average rating of the field, the normal quantile of
+    the confidence interval (95% by default) and maximum fitting iterations as parameters;
+    fits Bradley-Terry strengths to the results by minorization-maximization, with one virtual
+    tie per pairing so a player who never won or never lost still gets a finite rating; returns
+    list of Rating, best first, with each interval from the Fisher information of that
+    player's games, empty when there are no records"""
+    games = collections.Counter()  # frozenset of two names -> games played
+    scores = collections.Counter()  # name -> wins plus half the ties
+    played = collections.Counter()
+
+    for record in records:
+        games[frozenset((record.black, record.white))] += 1
+        played[record.black] += 1
+        played[record.white] += 1
+        if record.winner is None:
+            scores[record.black] += 0.5
+            scores[record.white] += 0.5
+        else:
+            scores[record.winner] += 1
+
+    names = sorted(played)
+    if not names:
+        return []
+
+    opponents = {name: [] for name in names}  # name -> list of (opponent, games with virtual tie)
+    for pairing, count in games.items():
+        first, second = sorted(pairing)
+        opponents[first].append((second, count + 1))
+        opponents[second].append((first, count + 1))
+
+    strength = {name: 1.0 for name in names}
+    for _ in range(iterations):
+        updated = {}
+        for name in names:
+            total = sum(count / (strength[name] + strength[other])
+                        for other, count in opponents[name])
+            updated[name] = (scores[name] + 0.5 * len(opponents[name])) / total
+
+        # keep the geometric mean at 1 so the ratings average to the anchor
+        mean_log = sum(math.log(value) for value in updated.values()) / len(names)
+        updated = {name: value / math.exp(mean_log) for name, value in updated.items()}
+
+        change = max(abs(math.log(updated[name] / strength[name])) for name in names)
+        strength = updated
+        if change < 1e-9:
+            break
+
+    ratings = []
+    for name in names:
+        information = 0.0
+        for other, count in opponents[name]:
+            expected = strength[name] / (strength[name] + strength[other])
+            information += count * expected * (1 - expected)
+
+        elo = anchor + ELO_SCALE * math.log(strength[name])
+        margin = confidence * ELO_SCALE / math.sqrt(information)
+        ratings.append(Rating(name, elo, elo - margin, elo + margin, played[name], scores[name]))
+
+    ratings.sort(key=lambda rating: rating.elo, reverse=True)
+    return ratings
+
+
+def format_ratings(ratings):
+    """takes list of Rating as a parameter; returns the standings as a text table"""
+    lines = ["%-12s %7s %17s %7s %7s" % ("player", "elo", "95% interval", "games", "score")]
+    for rating in ratings:
+        lines.append("%-12s %7.1f  [%6.1f, %6.1f] %7d %6.1f%%" % (
+            rating.name, rating.elo, rating.low, rating.high, rating.games,
+            rating.score / rating.games * 100))
+
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a round-robin Othello tournament.")
+    parser.add_argument("players", nargs="+", choices=sorted(STRATEGIES))
+    parser.add_argument("--games", type=int, default=100, help="games per pairing, even")
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--report-every", type=int, default=0,
+                        help="print the standings after every this many games")
+    args = parser.parse_args()
+
+    records = []
+    start = time.perf_counter()
+
+    results = run_tournament(args.players, args.games, args.workers, args.seed, args.batch_size)
+    for record in results:
+        records.append(record)
+        if args.report_every and len(records) % args.report_every == 0:
+            print("after %d games:" % len(records))
+            print(format_ratings(compute_ratings(records)))
+
+    print(format_ratings(compute_ratings(records)))
+    elapsed = time.perf_counter() - start
+    print("games: %d  games/sec: %.1f" % (len(records), len(records) / elapsed))
+
+
+if __name__ == '__main__':
+    main()
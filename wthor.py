@@ -0,0 +1,174 @@
+# Author: Paige Knickerbocker
+# GitHub username: knickerbockermt
+# Date: 10/17/2026
+# Description: Streaming importer for WTHOR (.wtb) Othello game databases. A .wtb file is a
+# 16 byte header followed by 68 byte game records: tournament number, black and white player
+# numbers, black's final score, black's theoretical score and 60 move bytes of 10 * row + col,
+# 0 after the last move. Records are read and decoded a chunk at a time, each game is checked
+# by replaying it through Othello.return_available_positions and Othello.make_move, and valid
+# games are yielded lazily. Chunks can be validated across a pool of worker processes; games
+# still come out in file order.
+
+import argparse
+import collections
+import concurrent.futures
+import os
+import struct
+
+from Othello import Othello
+
+# century, year, month, day, games, records, year of the games, board size, game type, depth
+HEADER = struct.Struct("<BBBBIHHBBBx")
+# tournament, black player, white player, black score, theoretical score, moves
+RECORD = struct.Struct("<HHHBB60s")
+CHUNK_GAMES = 4096
+
+WthorHeader = collections.namedtuple(
+    "WthorHeader", ["created", "games", "year", "board_size", "depth"])
+WthorGame = collections.namedtuple(
+    "WthorGame", ["tournament", "black_player", "white_player", "black_score",
+                  "theoretical_score", "moves"])
+
+
+def read_header(wthor_file):
+    """takes a .wtb file opened in binary mode as a parameter; reads and returns its
+    WthorHeader; raises ValueError if the header is short or the games are not 8x8 games"""
+    data = wthor_file.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError("file too short for a WTHOR header")
+
+    century, year, month, day, games, _, game_year, board_size, game_type, depth = HEADER.unpack(data)
+    if board_size not in (0, 8) or game_type != 0:
+        raise ValueError("only 8x8 WTHOR game databases are supported")
+
+    return WthorHeader((century * 100 + year, month, day), games, game_year, 8, depth)
+
+
+def decode_chunk(data):
+    """takes bytes holding whole game records as a parameter; returns list of WthorGame with
+    moves as lists of (row, col)"""
+    games = []
+
+    for tournament, black, white, score, theoretical, move_bytes in RECORD.iter_unpack(data):
+        moves = []
+        for move in move_bytes:
+            if move == 0:
+                break
+            moves.append((move // 10, move % 10))
+
+        games.append(WthorGame(tournament, black, white, score, theoretical, moves))
+
+    return games
+
+
+def validate_game(wthor_game, engine="bitboard"):
+    """takes a WthorGame and optional engine name as parameters; replays the moves, passing for
+    a color with no available position; returns None if every move is available and black's
+    final score, counting empty squares for the winner as WTHOR does, matches the record,
+    otherwise a string describing the problem"""
+    game = Othello(engine)
+    color, opponent = "black", "white"
+
+    for ply, position in enumerate(wthor_game.moves):
+        available = game.return_available_positions(color)
+        if not available:
+            color, opponent = opponent, color
+            available = game.return_available_positions(color)
+
+        if position not in available:
+            return "invalid move %s for %s at ply %d" % (position, color, ply)
+
+        game.make_move(color, position)
+        color, opponent = opponent, color
+
+    black_pieces, white_pieces = game.get_piece_counts()
+    empty = 64 - black_pieces - white_pieces
+    if black_pieces > white_pieces:
+        black_pieces += empty
+    elif black_pieces == white_pieces:
+        black_pieces += empty // 2
+
+    if black_pieces != wthor_game.black_score:
+        return "black score %d does not match replayed score %d" % (wthor_game.black_score, black_pieces)
+
+    return None
+
+
+def validate_chunk(data, engine="bitboard", skip_invalid=True):
+    """worker function; takes bytes of whole game records, engine name and whether to drop
+    invalid games as parameters; returns list of the valid WthorGame; raises ValueError on the
+    first invalid game when skip_invalid is false"""
+    valid = []
+
+    for wthor_game in decode_chunk(data):
+        problem = validate_game(wthor_game, engine)
+        if problem is None:
+            valid.append(wthor_game)
+        elif not skip_invalid:
+            raise ValueError(problem)
+
+    return valid
+
+
+def read_chunks(path, chunk_games=CHUNK_GAMES):
+    """takes file path and games per chunk as parameters; generator that yields the header,
+    then bytes of up to chunk_games whole records at a time"""
+    with open(path, "rb") as wthor_file:
+        header = read_header(wthor_file)
+        yield header
+
+        remaining = header.games
+        while remaining > 0:
+            data = wthor_file.read(min(chunk_games, remaining) * RECORD.size)
+            data = data[:len(data) - len(data) % RECORD.size]  # a truncated file ends early
+            if not data:
+                return
+
+            remaining -= len(data) // RECORD.size
+            yield data
+
+
+def import_games(path, workers=1, engine="bitboard", skip_invalid=True, chunk_games=CHUNK_GAMES):
+    """takes file path, number of worker processes (all cores when None), engine name, whether
+    to drop invalid games and games per chunk as parameters; generator that yields each valid
+    WthorGame in file order; with more than one worker, chunks are validated in parallel with
+    a few chunks queued per worker"""
+    chunks = read_chunks(path, chunk_games)
+    next(chunks)  # header
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        for data in chunks:
+            yield from validate_chunk(data, engine, skip_invalid)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = collections.deque()
+
+        for data in chunks:
+            pending.append(pool.submit(validate_chunk, data, engine, skip_invalid))
+            if len(pending) >= workers * 4:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import and validate WTHOR game databases.")
+    parser.add_argument("paths", nargs="+", help=".wtb files")
+    parser.add_argument("--workers", type=int, default=1, help="0 for all cores")
+    args = parser.parse_args()
+
+    for path in args.paths:
+        with open(path, "rb") as wthor_file:
+            header = read_header(wthor_file)
+
+        valid = sum(1 for _ in import_games(path, args.workers or None))
+        print(path, "year:", header.year, "games:", header.games, "valid:", valid)
+
+
+if __name__ == '__main__':
+    main()